@@ -6,6 +6,7 @@ Provides entry points for the bot handler layer:
   multi-step orchestrator (parse → validate → clarify → confirm).
 - :func:`process_callback` — handle inline keyboard button presses
   (confirm / edit / cancel).
+- :func:`warmup` — pre-open LLM provider connections at bot startup.
 
 Both functions return an :class:`~finbot.agent.orchestrator.OrchestratorResult`.
 """
@@ -62,6 +63,18 @@ def set_orchestrator(orch: Orchestrator) -> None:
     _orchestrator = orch
 
 
+async def warmup() -> None:
+    """Pre-warm the LLM client so the first user message skips cold-start cost.
+
+    Called from the bot's startup hook.  Clients without a ``warmup``
+    method (e.g. test doubles) are left alone.
+    """
+    client = get_llm_client()
+    if hasattr(client, "warmup"):
+        await client.warmup()
+        logger.info("LLM client warmed up")
+
+
 async def process_message(
     user_id: int,
     text: str,
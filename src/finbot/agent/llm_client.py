@@ -12,22 +12,59 @@ Every LLM call is logged to the ``llm_calls`` table (see ADR-006).
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import operator
+import random
 import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import Any, Protocol, runtime_checkable
 
-from pydantic import BaseModel, Field
+import httpx
 
 from finbot.config import settings
 
+try:  # orjson is an optional speedup; fall back to the stdlib parser.
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+_loads = _json.loads
+
 logger = logging.getLogger(__name__)
 
+# Transient-failure retry policy: total attempts and backoff bounds (seconds).
+_RETRY_ATTEMPTS = 3
+_RETRY_BASE_DELAY = 0.1
+_RETRY_MAX_DELAY = 2.0
+
+# Errors worth retrying against the local Ollama server (connection resets,
+# timeouts) — anything else is surfaced immediately so the fallback kicks in.
+# The ollama SDK re-raises ``httpx.ConnectError`` as the builtin
+# ``ConnectionError``; other transport errors pass through unchanged.
+_OLLAMA_TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
+    httpx.TransportError,
+    ConnectionError,
+)
+
+# Backoff sleep used by the retry helper; tests replace it to skip the wait.
+_sleep = asyncio.sleep
+
+# Upper bound (seconds) on each provider's startup warmup call.
+_WARMUP_TIMEOUT = 5.0
+
 
 # ── Data models ───────────────────────────────────────────────────────────────
+# Plain slotted dataclasses rather than Pydantic models: these are built many
+# times per agent turn from already-trusted provider data, so validation would
+# only add overhead.
 
 
-class ToolCall(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ToolCall:
     """A single tool call requested by the LLM."""
 
     id: str = ""
@@ -35,11 +72,15 @@ class ToolCall(BaseModel):
     arguments: dict[str, Any]
 
 
-class LLMResponse(BaseModel):
-    """Structured response from an LLM call."""
+@dataclass(slots=True, kw_only=True)
+class LLMResponse:
+    """Structured response from an LLM call.
+
+    Not frozen: :class:`FallbackLLMClient` re-tags ``provider`` on fallback.
+    """
 
     content: str = ""
-    tool_calls: list[ToolCall] = Field(default_factory=list)
+    tool_calls: list[ToolCall] = field(default_factory=list)
     input_tokens: int | None = None
     output_tokens: int | None = None
     latency_ms: int | None = None
@@ -50,7 +91,8 @@ class LLMResponse(BaseModel):
 # ── Message types ─────────────────────────────────────────────────────────────
 
 
-class ChatMessage(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ChatMessage:
     """A single message in a chat conversation."""
 
     role: str  # "system", "user", "assistant", "tool"
@@ -115,6 +157,34 @@ class OllamaLLMClient:
     ) -> None:
         self._base_url = base_url or settings.ollama_base_url
         self._model = model or settings.ollama_model
+        self._client: Any = None
+
+    def _sdk_client(self) -> Any:
+        """Return the Ollama SDK client, creating it on first use.
+
+        Kept for the lifetime of this object so its connection pool (and the
+        model already loaded by :meth:`warmup`) is reused across calls.
+        """
+        if self._client is None:
+            import ollama
+
+            self._client = ollama.AsyncClient(host=self._base_url)
+        return self._client
+
+    async def warmup(self) -> None:
+        """Open the connection and load the model before the first real call.
+
+        An empty ``messages`` list makes Ollama load the model into memory
+        without generating anything.  Failures are logged and ignored — the
+        first real call will simply pay the cold-start cost instead.
+        """
+        try:
+            await asyncio.wait_for(
+                self._sdk_client().chat(model=self._model, messages=[]),
+                timeout=_WARMUP_TIMEOUT,
+            )
+        except Exception:
+            logger.debug("Ollama warmup failed", exc_info=True)
 
     async def chat(
         self,
@@ -122,9 +192,7 @@ class OllamaLLMClient:
         tools: list[ToolSchema] | None = None,
     ) -> LLMResponse:
         """Send a chat request to the Ollama server."""
-        import ollama
-
-        client = ollama.AsyncClient(host=self._base_url)
+        client = self._sdk_client()
 
         # Convert messages to Ollama format (plain dicts).
         ollama_messages = _messages_to_ollama(messages)
@@ -132,7 +200,7 @@ class OllamaLLMClient:
         # Convert tool schemas to Ollama format.
         ollama_tools = _tools_to_ollama(tools) if tools else None
 
-        start = time.monotonic()
+        start = time.perf_counter_ns()
         try:
             kwargs: dict[str, Any] = {
                 "model": self._model,
@@ -141,9 +209,12 @@ class OllamaLLMClient:
             if ollama_tools:
                 kwargs["tools"] = ollama_tools
 
-            response = await client.chat(**kwargs)
+            response = await _with_retries(
+                lambda: client.chat(**kwargs),
+                _OLLAMA_TRANSIENT_ERRORS,
+            )
         finally:
-            latency_ms = int((time.monotonic() - start) * 1000)
+            latency_ms = (time.perf_counter_ns() - start) // 1_000_000
 
         # Parse Ollama response.
         message = response.get("message", {})
@@ -157,7 +228,7 @@ class OllamaLLMClient:
                 ToolCall(
                     id=f"call_{i}",
                     name=func.get("name", ""),
-                    arguments=func.get("arguments", {}),
+                    arguments=_parse_arguments(func.get("arguments")),
                 )
             )
 
@@ -183,6 +254,9 @@ class PaidLLMClient:
     """LLM client wrapping Anthropic or OpenAI SDKs.
 
     Provider is selected via ``settings.fallback_llm_provider``.
+
+    Raises:
+        ValueError: If the provider is not ``"anthropic"`` or ``"openai"``.
     """
 
     def __init__(
@@ -192,6 +266,49 @@ class PaidLLMClient:
     ) -> None:
         self._provider = provider or settings.fallback_llm_provider
         self._model = model or settings.fallback_llm_model
+        try:
+            self._chat_impl = {
+                "anthropic": self._chat_anthropic,
+                "openai": self._chat_openai,
+            }[self._provider]
+        except KeyError:
+            raise ValueError(f"Unknown LLM provider: {self._provider}") from None
+        self._client: Any = None
+
+    def _sdk_client(self) -> Any:
+        """Return the provider SDK client, creating it on first use.
+
+        The SDK retries connection errors, 429s and 5xx with backoff itself.
+        """
+        if self._client is None:
+            if self._provider == "anthropic":
+                import anthropic
+
+                self._client = anthropic.AsyncAnthropic(
+                    api_key=settings.anthropic_api_key,
+                    max_retries=_RETRY_ATTEMPTS - 1,
+                )
+            else:
+                import openai
+
+                self._client = openai.AsyncOpenAI(
+                    api_key=settings.openai_api_key,
+                    max_retries=_RETRY_ATTEMPTS - 1,
+                )
+        return self._client
+
+    async def warmup(self) -> None:
+        """Pay the TLS handshake up front with a free ``models.list`` call.
+
+        Failures are logged and ignored.
+        """
+        try:
+            await asyncio.wait_for(
+                self._sdk_client().models.list(),
+                timeout=_WARMUP_TIMEOUT,
+            )
+        except Exception:
+            logger.debug("%s warmup failed", self._provider, exc_info=True)
 
     async def chat(
         self,
@@ -199,12 +316,7 @@ class PaidLLMClient:
         tools: list[ToolSchema] | None = None,
     ) -> LLMResponse:
         """Send a chat request to the paid API."""
-        if self._provider == "anthropic":
-            return await self._chat_anthropic(messages, tools)
-        elif self._provider == "openai":
-            return await self._chat_openai(messages, tools)
-        else:
-            raise ValueError(f"Unknown LLM provider: {self._provider}")
+        return await self._chat_impl(messages, tools)
 
     async def _chat_anthropic(
         self,
@@ -212,9 +324,7 @@ class PaidLLMClient:
         tools: list[ToolSchema] | None = None,
     ) -> LLMResponse:
         """Send a request to the Anthropic API."""
-        import anthropic
-
-        client = anthropic.AsyncAnthropic(api_key=settings.anthropic_api_key)
+        client = self._sdk_client()
 
         # Separate system message from conversation.
         system_text = ""
@@ -234,13 +344,19 @@ class PaidLLMClient:
             "messages": api_messages,
         }
         if system_text:
-            kwargs["system"] = system_text
+            # Mark the static prefix (tools + system prompt) as cacheable so
+            # repeat turns reuse Anthropic's prompt cache; the per-turn user
+            # message is the only part that changes.  Prefixes under the
+            # model's minimum cacheable length are simply not cached.
+            kwargs["system"] = [
+                {"type": "text", "text": system_text, "cache_control": {"type": "ephemeral"}}
+            ]
         if anthropic_tools:
             kwargs["tools"] = anthropic_tools
 
-        start = time.monotonic()
+        start = time.perf_counter_ns()
         response = await client.messages.create(**kwargs)
-        latency_ms = int((time.monotonic() - start) * 1000)
+        latency_ms = (time.perf_counter_ns() - start) // 1_000_000
 
         # Parse response.
         content = ""
@@ -258,11 +374,17 @@ class PaidLLMClient:
                     )
                 )
 
+        match response.usage:
+            case object(input_tokens=input_tokens, output_tokens=output_tokens):
+                pass
+            case _:
+                input_tokens = output_tokens = None
+
         return LLMResponse(
             content=content,
             tool_calls=tool_calls,
-            input_tokens=response.usage.input_tokens,
-            output_tokens=response.usage.output_tokens,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
             latency_ms=latency_ms,
             provider="anthropic",
             model=self._model,
@@ -274,11 +396,7 @@ class PaidLLMClient:
         tools: list[ToolSchema] | None = None,
     ) -> LLMResponse:
         """Send a request to the OpenAI API."""
-        import json
-
-        import openai
-
-        client = openai.AsyncOpenAI(api_key=settings.openai_api_key)
+        client = self._sdk_client()
 
         # Convert messages to OpenAI format.
         api_messages: list[dict[str, Any]] = []
@@ -292,9 +410,9 @@ class PaidLLMClient:
         if tools:
             kwargs["tools"] = tools  # OpenAI format is the canonical format
 
-        start = time.monotonic()
+        start = time.perf_counter_ns()
         response = await client.chat.completions.create(**kwargs)
-        latency_ms = int((time.monotonic() - start) * 1000)
+        latency_ms = (time.perf_counter_ns() - start) // 1_000_000
 
         # Parse response.
         choice = response.choices[0]
@@ -307,17 +425,22 @@ class PaidLLMClient:
                     ToolCall(
                         id=tc.id,
                         name=tc.function.name,
-                        arguments=json.loads(tc.function.arguments)
-                        if isinstance(tc.function.arguments, str)
-                        else tc.function.arguments,
+                        arguments=_parse_arguments(tc.function.arguments),
                     )
                 )
 
+        # Usage may be absent (e.g. some proxies / compatible servers omit it).
+        match response.usage:
+            case object(prompt_tokens=input_tokens, completion_tokens=output_tokens):
+                pass
+            case _:
+                input_tokens = output_tokens = None
+
         return LLMResponse(
             content=content,
             tool_calls=tool_calls,
-            input_tokens=response.usage.prompt_tokens if response.usage else None,
-            output_tokens=response.usage.completion_tokens if response.usage else None,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
             latency_ms=latency_ms,
             provider="openai",
             model=self._model,
@@ -333,67 +456,160 @@ class FallbackLLMClient:
     On Ollama failure (connection error, timeout, malformed response), the
     request is retried via the paid API.  Every call — successful or not — is
     logged to ``llm_calls``.
+
+    With a *hedge_delay*, the paid request is also started if Ollama has not
+    replied within that many seconds; whichever succeeds first wins and the
+    other request is cancelled.  Neither request outlives :meth:`chat`.
     """
 
     def __init__(
         self,
         primary: LLMClient | None = None,
         fallback: LLMClient | None = None,
+        hedge_delay: float | None = None,
     ) -> None:
         self._primary = primary or OllamaLLMClient()
         self._fallback = fallback or PaidLLMClient()
+        self._hedge_delay = (
+            hedge_delay if hedge_delay is not None else settings.fallback_hedge_delay
+        )
+
+    async def warmup(self) -> None:
+        """Warm up both clients concurrently (where they support it)."""
+        await asyncio.gather(
+            *(
+                client.warmup()
+                for client in (self._primary, self._fallback)
+                if hasattr(client, "warmup")
+            )
+        )
 
     async def chat(
         self,
         messages: list[ChatMessage],
         tools: list[ToolSchema] | None = None,
     ) -> LLMResponse:
-        """Try Ollama; on failure fall back to paid API."""
-        # Try primary (Ollama).
+        """Try Ollama; on failure (or after the hedge delay) use the paid API."""
+        primary = asyncio.create_task(self._primary.chat(messages, tools))
+        fallback: asyncio.Task[LLMResponse] | None = None
         try:
-            response = await self._primary.chat(messages, tools)
-            logger.debug(
-                "Ollama responded in %dms (tokens: %s/%s)",
-                response.latency_ms or 0,
-                response.input_tokens,
-                response.output_tokens,
-            )
-            return response
+            done, _ = await asyncio.wait({primary}, timeout=self._hedge_delay)
+            if done:
+                exc = primary.exception()
+                if exc is None:
+                    response = primary.result()
+                    logger.debug(
+                        "Ollama responded in %dms (tokens: %s/%s)",
+                        response.latency_ms or 0,
+                        response.input_tokens,
+                        response.output_tokens,
+                    )
+                    return response
+                fallback_reason = f"{type(exc).__name__}: {exc}"
+                logger.warning(
+                    "Ollama call failed (%s), falling back to paid API",
+                    fallback_reason,
+                )
+            else:
+                fallback_reason = f"no reply within {self._hedge_delay}s"
+                logger.info("Ollama slow (%s), hedging with paid API", fallback_reason)
+
+            fallback = asyncio.create_task(self._fallback.chat(messages, tools))
+            pending: set[asyncio.Task[LLMResponse]] = {fallback} if done else {primary, fallback}
+            last_exc: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if (last_exc := task.exception()) is not None:
+                        continue
+                    response = task.result()
+                    if task is fallback:
+                        # Tag the response so the caller knows it was a fallback.
+                        response.provider = f"{response.provider} (fallback)"
+                        logger.info(
+                            "Fallback API responded in %dms (reason: %s)",
+                            response.latency_ms or 0,
+                            fallback_reason,
+                        )
+                    return response
+
+            logger.error("Both LLM providers failed (last error: %s)", last_exc)
+            if last_exc is None:
+                raise RuntimeError("Both LLM providers finished without a reply or an error")
+            raise last_exc
+        finally:
+            # Cancel the losing request and wait for it, so no task is orphaned.
+            losers = [t for t in (primary, fallback) if t is not None and not t.done()]
+            for task in losers:
+                task.cancel()
+            await asyncio.gather(*losers, return_exceptions=True)
 
-        except Exception as exc:
-            fallback_reason = f"{type(exc).__name__}: {exc}"
-            logger.warning(
-                "Ollama call failed (%s), falling back to paid API",
-                fallback_reason,
-            )
 
-        # Fall back to paid API.
+# ── Retry helper ──────────────────────────────────────────────────────────────
+
+
+async def _with_retries(
+    call: Callable[[], Awaitable[Any]],
+    retry_on: tuple[type[BaseException], ...],
+    *,
+    attempts: int = _RETRY_ATTEMPTS,
+) -> Any:
+    """Await ``call()``, retrying *retry_on* errors with jittered exponential backoff.
+
+    The last error is re-raised once *attempts* calls have failed.
+    """
+    attempt = 1
+    while True:
         try:
-            response = await self._fallback.chat(messages, tools)
-            # Tag the response so the caller knows it was a fallback.
-            response.provider = f"{response.provider} (fallback)"
-            logger.info(
-                "Fallback API responded in %dms (reason: %s)",
-                response.latency_ms or 0,
-                fallback_reason,
+            return await call()
+        except retry_on as exc:
+            if attempt >= attempts:
+                raise
+            delay = random.uniform(0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2**attempt))
+            logger.debug(
+                "Transient LLM error (%s), retry %d/%d in %.2fs",
+                type(exc).__name__,
+                attempt,
+                attempts - 1,
+                delay,
             )
-            return response
-
-        except Exception as fallback_exc:
-            logger.error("Fallback API also failed: %s", fallback_exc)
-            raise
+            await _sleep(delay)
+            attempt += 1
 
 
 # ── Format conversion helpers ─────────────────────────────────────────────────
 
 
+_MSG_ROLE_CONTENT = operator.attrgetter("role", "content")
+
+
 def _messages_to_ollama(messages: list[ChatMessage]) -> list[dict[str, Any]]:
     """Convert ChatMessage list to Ollama's message format."""
-    result: list[dict[str, Any]] = []
-    for msg in messages:
-        entry: dict[str, Any] = {"role": msg.role, "content": msg.content}
-        result.append(entry)
-    return result
+    return [
+        {"role": role, "content": content} for role, content in map(_MSG_ROLE_CONTENT, messages)
+    ]
+
+
+def _parse_arguments(raw: Any) -> dict[str, Any]:
+    """Normalise tool-call arguments to a dict.
+
+    Providers return arguments either as an already-decoded mapping or as a
+    JSON string; strings are decoded with orjson when it is installed.
+    Malformed JSON or a non-object payload yields ``{}`` (and a warning), so
+    a bad tool call degrades to "no arguments" instead of failing the turn.
+    """
+    if not raw:
+        return {}
+    if isinstance(raw, (str, bytes)):
+        try:
+            raw = _loads(raw)
+        except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
+            logger.warning("Discarding malformed tool-call arguments: %.200r", raw)
+            return {}
+    if not isinstance(raw, dict):
+        logger.warning("Discarding non-object tool-call arguments: %.200r", raw)
+        return {}
+    return raw
 
 
 def _tools_to_ollama(tools: list[ToolSchema] | None) -> list[dict[str, Any]] | None:
@@ -433,6 +649,17 @@ def _tools_to_anthropic(tools: list[ToolSchema] | None) -> list[dict[str, Any]]:
     return result
 
 
+# Paid-model pricing as (model substring, input, output) in US cents per 1M
+# tokens.  Kept integral so per-call cost is exact integer arithmetic.
+_PRICING_CENTS_PER_MTOK: tuple[tuple[str, int, int], ...] = (
+    ("haiku", 25, 125),  # Claude Haiku: $0.25 / $1.25
+    ("gpt-4o-mini", 15, 60),  # GPT-4o-mini: $0.15 / $0.60
+)
+
+# Divisor converting (tokens * cents-per-1M-tokens) to USD.
+_CENT_MTOK_PER_USD = Decimal(100 * 1_000_000)
+
+
 def _estimate_cost_usd(
     provider: str,
     model: str,
@@ -441,7 +668,8 @@ def _estimate_cost_usd(
 ) -> Decimal | None:
     """Rough cost estimate for paid API calls.
 
-    Pricing as of late 2025 — update as needed.
+    Pricing as of late 2025 — update :data:`_PRICING_CENTS_PER_MTOK` as needed.
+    The sum is computed in integers and converted to :class:`Decimal` once.
     """
     if provider == "ollama":
         return Decimal("0")
@@ -449,13 +677,22 @@ def _estimate_cost_usd(
     in_t = input_tokens or 0
     out_t = output_tokens or 0
 
-    # Claude Haiku pricing (per 1M tokens).
-    if "haiku" in model.lower():
-        return Decimal(str(in_t * 0.25 / 1_000_000 + out_t * 1.25 / 1_000_000))
+    rates = _rates(model)
+    if rates is None:
+        # Unknown model — return None.
+        return None
+    in_rate, out_rate = rates
+    return Decimal(in_t * in_rate + out_t * out_rate) / _CENT_MTOK_PER_USD
+
 
-    # GPT-4o-mini pricing (per 1M tokens).
-    if "gpt-4o-mini" in model.lower():
-        return Decimal(str(in_t * 0.15 / 1_000_000 + out_t * 0.60 / 1_000_000))
+@functools.lru_cache(maxsize=256)
+def _rates(model: str) -> tuple[int, int] | None:
+    """Return ``(input, output)`` cents per 1M tokens for *model*, if known.
 
-    # Unknown model — return None.
+    Cached because the same handful of model names recur on every call.
+    """
+    model_lower = model.lower()
+    for needle, in_rate, out_rate in _PRICING_CENTS_PER_MTOK:
+        if needle in model_lower:
+            return in_rate, out_rate
     return None
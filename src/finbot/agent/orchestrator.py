@@ -16,11 +16,12 @@ converts into a Telegram reply.
 from __future__ import annotations
 
 import contextlib
+import functools
 import logging
 import re
 import traceback as tb_module
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Any
@@ -42,13 +43,14 @@ from finbot.agent.prompts import (
     SYSTEM_PROMPT,
 )
 from finbot.agent.state import (
+    AbstractConversationStore,
     ConversationContext,
     ConversationState,
-    ConversationStore,
     PendingExpense,
-    conversation_store,
+    get_conversation_store,
 )
 from finbot.config import UTILITY_SUBTYPES, settings
+from finbot.ledger.models import LedgerEntry
 from finbot.ledger.repository import (
     ensure_category_alias,
     get_category_aliases,
@@ -56,7 +58,7 @@ from finbot.ledger.repository import (
     get_partner_id,
     get_partnership,
     save_failure,
-    save_ledger_entry,
+    save_ledger_entries,
 )
 from finbot.tools import default_registry
 
@@ -76,6 +78,17 @@ _LLM_AUTH_REPLY = (
     "OPENAI_API_KEY or ANTHROPIC_API_KEY in your .env."
 )
 
+# Canned replies for bare small talk, answered without an LLM round-trip.
+# Only short messages are matched, so "hi, groceries 300" still gets parsed.
+_SMALL_TALK_MAX_LEN = 32
+_GREETING_RE = re.compile(
+    r"(?:hi|hello|hey|hiya|yo|shalom|good\s+(?:morning|afternoon|evening))"
+    r"(?:\s+there)?[\s!.?]*"
+)
+_THANKS_RE = re.compile(r"(?:thanks|thank\s+you|thx|ty)(?:\s+(?:a\s+lot|so\s+much))?[\s!.?]*")
+_GREETING_REPLY = "Hello! Send me an expense to track."
+_THANKS_REPLY = "You're welcome! Send me another expense whenever you like."
+
 
 def _is_llm_auth_error(exc: BaseException) -> bool:
     """True if the exception looks like an LLM API auth error (401 / invalid key)."""
@@ -88,9 +101,9 @@ def _is_llm_auth_error(exc: BaseException) -> bool:
     )
 
 
-def _return_auth_error(store: ConversationStore, user_id: int) -> OrchestratorResult:
+async def _return_auth_error(store: AbstractConversationStore, user_id: int) -> OrchestratorResult:
     """Clear conversation state and return a user-facing auth error result."""
-    store.clear(user_id)
+    await store.clear(user_id)
     logger.warning("LLM call failed: invalid or missing API key for fallback provider")
     return OrchestratorResult(reply_text=_LLM_AUTH_REPLY)
 
@@ -149,6 +162,10 @@ class OrchestratorResult:
 class Orchestrator:
     """Multi-step state machine for the agent conversation flow.
 
+    Each turn runs under the store's per-user lock, so a user's messages and
+    button presses are handled one at a time (a double-tapped Confirm cannot
+    commit twice) while other users proceed in parallel.
+
     Args:
         llm_client: The LLM client to use for chat completions.
         store: Conversation state store (defaults to the module-level singleton).
@@ -157,10 +174,10 @@ class Orchestrator:
     def __init__(
         self,
         llm_client: LLMClient,
-        store: ConversationStore | None = None,
+        store: AbstractConversationStore | None = None,
     ) -> None:
         self._llm = llm_client
-        self._store = store or conversation_store
+        self._store = store or get_conversation_store()
 
     # ── Public entry points ───────────────────────────────────────────────
 
@@ -182,27 +199,33 @@ class Orchestrator:
         Returns:
             An :class:`OrchestratorResult` for the bot handler to send.
         """
-        ctx = self._store.get(user_id)
+        async with self._store.lock(user_id):
+            ctx = await self._store.get(user_id)
 
-        # If the user is in CLARIFYING state, this text is an answer to a
-        # clarification question — merge it into the pending data.
-        if ctx.state == ConversationState.CLARIFYING:
-            return await self._handle_clarification_answer(
-                user_id,
-                text,
-                ctx,
-                session,
-            )
+            # If the user is in CLARIFYING state, this text is an answer to a
+            # clarification question — merge it into the pending data.
+            if ctx.state == ConversationState.CLARIFYING:
+                return await self._handle_clarification_answer(
+                    user_id,
+                    text,
+                    ctx,
+                    session,
+                )
 
-        # Otherwise, start a fresh parsing round.
-        ctx = ConversationContext(
-            state=ConversationState.PARSING,
-            raw_input_id=raw_input_id,
-            original_text=text,
-        )
-        self._store.set(user_id, ctx)
+            # Bare greetings / thanks need no parsing — answer without the LLM.
+            if (reply := _small_talk_reply(text)) is not None:
+                await self._store.clear(user_id)
+                return OrchestratorResult(reply_text=reply)
+
+            # Otherwise, start a fresh parsing round.
+            ctx = ConversationContext(
+                state=ConversationState.PARSING,
+                raw_input_id=raw_input_id,
+                original_text=text,
+            )
+            await self._store.set(user_id, ctx)
 
-        return await self._parse_and_validate(user_id, text, ctx, session)
+            return await self._parse_and_validate(user_id, text, ctx, session)
 
     async def handle_callback(
         self,
@@ -220,22 +243,23 @@ class Orchestrator:
         Returns:
             An :class:`OrchestratorResult` for the bot handler to send.
         """
-        ctx = self._store.get(user_id)
-        action = callback_data.split(":")[0]
+        async with self._store.lock(user_id):
+            ctx = await self._store.get(user_id)
+            action = callback_data.split(":")[0]
 
-        if ctx.state != ConversationState.CONFIRMING:
-            return OrchestratorResult(
-                reply_text="No pending expenses to act on. Send a new expense.",
-            )
+            if ctx.state != ConversationState.CONFIRMING:
+                return OrchestratorResult(
+                    reply_text="No pending expenses to act on. Send a new expense.",
+                )
 
-        if action == _CB_CONFIRM:
-            return await self._commit(user_id, ctx, session)
-        elif action == _CB_EDIT:
-            return self._start_edit(user_id, ctx)
-        elif action == _CB_CANCEL:
-            return self._cancel(user_id)
-        else:
-            return OrchestratorResult(reply_text="Unknown action.")
+            if action == _CB_CONFIRM:
+                return await self._commit(user_id, ctx, session)
+            elif action == _CB_EDIT:
+                return await self._start_edit(user_id, ctx)
+            elif action == _CB_CANCEL:
+                return await self._cancel(user_id)
+            else:
+                return OrchestratorResult(reply_text="Unknown action.")
 
     # ── Internal: parsing ─────────────────────────────────────────────────
 
@@ -269,17 +293,17 @@ class Orchestrator:
                 initial,
             )
         if _looks_like_query(text) and not re.search(r"\d", text):
-            self._store.clear(user_id)
+            await self._store.clear(user_id)
             initial = LLMResponse()
             return await self._handle_query(user_id, text, session, initial)
 
         try:
             response = await self._llm.chat(messages=messages, tools=tools)
         except openai.AuthenticationError:
-            return _return_auth_error(self._store, user_id)
+            return await _return_auth_error(self._store, user_id)
         except Exception as e:
             if _is_llm_auth_error(e):
-                return _return_auth_error(self._store, user_id)
+                return await _return_auth_error(self._store, user_id)
             logger.exception("LLM call failed for message: %s", text[:100])
             reply = (
                 "I'm having trouble processing your message right now. "
@@ -293,7 +317,7 @@ class Orchestrator:
                 traceback_str=tb_module.format_exc(),
                 failure_source="llm_parse",
             )
-            self._store.clear(user_id)
+            await self._store.clear(user_id)
             return OrchestratorResult(reply_text=reply)
 
         _log_user_message(logger, "LLM request", text)
@@ -311,7 +335,7 @@ class Orchestrator:
         if parsed is not None and not has_expenses:
             intent = parsed.get("intent", "unknown")
             if intent == "query" or (intent in ("unknown", "greeting") and _looks_like_query(text)):
-                self._store.clear(user_id)
+                await self._store.clear(user_id)
                 return await self._handle_query(user_id, text, session, response)
             if intent == "settlement":
                 return await self._handle_settlement(
@@ -322,12 +346,12 @@ class Orchestrator:
                     response,
                 )
             if intent in ("greeting", "unknown"):
-                self._store.clear(user_id)
+                await self._store.clear(user_id)
                 return self._handle_non_expense_intent(intent, response)
 
         # No expenses extracted.
         if parsed is None or not has_expenses:
-            self._store.clear(user_id)
+            await self._store.clear(user_id)
             # If LLM returned text content, use it.
             if response.content and response.content.strip():
                 return OrchestratorResult(
@@ -343,10 +367,10 @@ class Orchestrator:
             )
 
         # Build PendingExpense objects.
-        ctx.pending_expenses = [PendingExpense.from_parsed(exp) for exp in parsed["expenses"]]
+        ctx.pending_expenses = PendingExpense.from_parsed_many(parsed["expenses"])
         _default_missing_payers_to_user(ctx.pending_expenses)
         ctx.state = ConversationState.VALIDATING
-        self._store.set(user_id, ctx)
+        await self._store.set(user_id, ctx)
 
         return await self._validate(user_id, ctx, llm_response=response, session=session)
 
@@ -517,7 +541,7 @@ class Orchestrator:
                 traceback_str=tb_module.format_exc(),
                 failure_source="llm_settlement",
             )
-            self._store.clear(user_id)
+            await self._store.clear(user_id)
             return OrchestratorResult(
                 reply_text=reply,
                 llm_responses=[initial_response],
@@ -532,7 +556,7 @@ class Orchestrator:
         settlement_data = self._extract_settlement(response)
 
         if settlement_data is None:
-            self._store.clear(user_id)
+            await self._store.clear(user_id)
             return OrchestratorResult(
                 reply_text=(
                     "I couldn't parse the settlement details. "
@@ -569,7 +593,7 @@ class Orchestrator:
         if pending.amount is None:
             ctx.state = ConversationState.CLARIFYING
             ctx.clarification_field = "amount"
-            self._store.set(user_id, ctx)
+            await self._store.set(user_id, ctx)
             return OrchestratorResult(
                 reply_text=(
                     "How much is the settlement for?\n"
@@ -582,7 +606,7 @@ class Orchestrator:
         if not pending.payer:
             ctx.state = ConversationState.CLARIFYING
             ctx.clarification_field = "payer"
-            self._store.set(user_id, ctx)
+            await self._store.set(user_id, ctx)
             return OrchestratorResult(
                 reply_text="Who made this payment? You or your partner?",
                 llm_responses=all_responses,
@@ -593,7 +617,7 @@ class Orchestrator:
         from finbot.bot.keyboards import confirmation_keyboard
 
         ctx.state = ConversationState.CONFIRMING
-        self._store.set(user_id, ctx)
+        await self._store.set(user_id, ctx)
 
         summary = format_settlement_confirmation(pending)
         return OrchestratorResult(
@@ -646,7 +670,7 @@ class Orchestrator:
         if ctx.all_complete():
             # All fields present — show confirmation.
             ctx.state = ConversationState.CONFIRMING
-            self._store.set(user_id, ctx)
+            await self._store.set(user_id, ctx)
 
             # Load known categories and label→category aliases from DB.
             known_cats = set(c.lower() for c in settings.default_categories)
@@ -680,7 +704,7 @@ class Orchestrator:
         idx, field_name = missing_info
         ctx.state = ConversationState.CLARIFYING
         ctx.clarification_field = field_name
-        self._store.set(user_id, ctx)
+        await self._store.set(user_id, ctx)
 
         question = _build_clarification_question(
             field_name,
@@ -768,7 +792,7 @@ class Orchestrator:
         if parsed and parsed.get("expenses"):
             # Update the pending expenses with merged data.
             old_expenses = ctx.pending_expenses
-            new_expenses = [PendingExpense.from_parsed(exp) for exp in parsed["expenses"]]
+            new_expenses = PendingExpense.from_parsed_many(parsed["expenses"])
             # Preserve count: if LLM returns different count, keep original.
             if len(new_expenses) == len(old_expenses):
                 new_expenses = _preserve_original_fields_on_merge(old_expenses, new_expenses)
@@ -805,7 +829,7 @@ class Orchestrator:
 
         ctx.state = ConversationState.VALIDATING
         ctx.clarification_field = None
-        self._store.set(user_id, ctx)
+        await self._store.set(user_id, ctx)
 
         return await self._validate(user_id, ctx, llm_response=response, session=session)
 
@@ -844,12 +868,12 @@ class Orchestrator:
                     if abs_balance > 0:
                         pending.amount = float(abs_balance)
                     else:
-                        self._store.clear(user_id)
+                        await self._store.clear(user_id)
                         return OrchestratorResult(
                             reply_text="\u2705 You're already settled up! No balance to pay.",
                         )
                 else:
-                    self._store.clear(user_id)
+                    await self._store.clear(user_id)
                     return OrchestratorResult(
                         reply_text="No partnership found. Use /setup first.",
                     )
@@ -884,7 +908,7 @@ class Orchestrator:
         if pending.amount is None:
             ctx.state = ConversationState.CLARIFYING
             ctx.clarification_field = "amount"
-            self._store.set(user_id, ctx)
+            await self._store.set(user_id, ctx)
             return OrchestratorResult(
                 reply_text=(
                     "How much is the settlement for?\n"
@@ -896,7 +920,7 @@ class Orchestrator:
         if not pending.payer:
             ctx.state = ConversationState.CLARIFYING
             ctx.clarification_field = "payer"
-            self._store.set(user_id, ctx)
+            await self._store.set(user_id, ctx)
             return OrchestratorResult(
                 reply_text="Who made this payment? You or your partner?",
             )
@@ -906,7 +930,7 @@ class Orchestrator:
         from finbot.bot.keyboards import confirmation_keyboard
 
         ctx.state = ConversationState.CONFIRMING
-        self._store.set(user_id, ctx)
+        await self._store.set(user_id, ctx)
 
         summary = format_settlement_confirmation(pending)
         return OrchestratorResult(
@@ -924,7 +948,7 @@ class Orchestrator:
     ) -> OrchestratorResult:
         """Write all pending expenses/settlements to the ledger and reset state."""
         if not ctx.raw_input_id:
-            self._store.clear(user_id)
+            await self._store.clear(user_id)
             return OrchestratorResult(
                 reply_text="Something went wrong — no input reference. Please try again.",
             )
@@ -937,6 +961,7 @@ class Orchestrator:
         alias_map = await get_category_aliases_safe(session) or None
 
         committed: list[str] = []
+        entries: list[LedgerEntry] = []
         for exp in ctx.pending_expenses:
             if exp.amount is None:
                 continue
@@ -964,25 +989,29 @@ class Orchestrator:
             if category and original_cat and category.strip().lower() != original_cat:
                 tags.append(f"category_from_alias:{original_cat}->{category.strip().lower()}")
 
-            await save_ledger_entry(
-                session,
-                raw_input_id=ctx.raw_input_id,
-                event_type=event_type,
-                amount=Decimal(str(exp.amount)),
-                currency=exp.currency,
-                category=category,
-                payer_telegram_id=payer_tid,
-                split_payer_pct=Decimal(str(exp.split_payer_pct or 100)),
-                split_other_pct=Decimal(str(exp.split_other_pct or 0)),
-                event_date=event_date,
-                description=exp.description,
-                tags=tags or None,
+            entries.append(
+                LedgerEntry(
+                    raw_input_id=ctx.raw_input_id,
+                    event_type=event_type,
+                    amount=Decimal(str(exp.amount)),
+                    currency=exp.currency,
+                    category=category,
+                    payer_telegram_id=payer_tid,
+                    split_payer_pct=Decimal(str(exp.split_payer_pct or 100)),
+                    split_other_pct=Decimal(str(exp.split_other_pct or 0)),
+                    event_date=event_date,
+                    description=exp.description,
+                    tags=tags or None,
+                )
             )
             label = _build_commit_label(exp.description, category, event_type)
             committed.append(f"  {exp.currency} {exp.amount} — {label}")
 
+        # One flush for the whole batch rather than one per expense.
+        await save_ledger_entries(session, entries)
+
         ctx.state = ConversationState.COMMITTING
-        self._store.set(user_id, ctx)
+        await self._store.set(user_id, ctx)
 
         count = len(committed)
         lines = "\n".join(committed)
@@ -993,7 +1022,7 @@ class Orchestrator:
             reply = f"\u2705 <b>Committed {count} expense(s) to the ledger:</b>\n{lines}"
 
         # Reset to IDLE.
-        self._store.clear(user_id)
+        await self._store.clear(user_id)
 
         return OrchestratorResult(
             reply_text=reply,
@@ -1002,7 +1031,7 @@ class Orchestrator:
 
     # ── Internal: edit ────────────────────────────────────────────────────
 
-    def _start_edit(
+    async def _start_edit(
         self,
         user_id: int,
         ctx: ConversationContext,
@@ -1010,7 +1039,7 @@ class Orchestrator:
         """Prompt the user for what they want to change."""
         ctx.state = ConversationState.CLARIFYING
         ctx.clarification_field = None  # General edit — next text parsed as correction
-        self._store.set(user_id, ctx)
+        await self._store.set(user_id, ctx)
 
         return OrchestratorResult(
             reply_text=(
@@ -1024,11 +1053,11 @@ class Orchestrator:
 
     # ── Internal: cancel ──────────────────────────────────────────────────
 
-    def _cancel(self, user_id: int) -> OrchestratorResult:
+    async def _cancel(self, user_id: int) -> OrchestratorResult:
         """Discard pending expenses and reset to IDLE."""
-        ctx = self._store.get(user_id)
+        ctx = await self._store.get(user_id)
         edit_id = ctx.confirmation_message_id
-        self._store.clear(user_id)
+        await self._store.clear(user_id)
         return OrchestratorResult(
             reply_text="\u274c Cancelled. No expenses were recorded.",
             edit_message_id=edit_id,
@@ -1059,6 +1088,19 @@ def _build_commit_label(
     return description or category or fallback
 
 
+# Clarification questions per missing field; {context} describes the expense.
+_SPLIT_QUESTION = "How should this expense{context} be split? (e.g. 50/50, 70/30, or 100/0)"
+_QUESTION_TEMPLATES: dict[str, str] = {
+    "payer": "Who paid{context}? You or your partner?",
+    "category": (
+        "What category is this expense{context}? (e.g. groceries, gas, dining, coffee, utilities)"
+    ),
+    "split_payer_pct": _SPLIT_QUESTION,
+    "split_other_pct": _SPLIT_QUESTION,
+    "amount": "What was the amount{context}?",
+}
+
+
 def _build_clarification_question(
     field_name: str,
     expense_idx: int,
@@ -1082,26 +1124,9 @@ def _build_clarification_question(
         if parts:
             context = f" for <b>{' — '.join(parts)}</b>"
 
-    multi = len(expenses) > 1
-    prefix = f"For expense #{expense_idx + 1}" if multi else ""
-
-    templates: dict[str, str] = {
-        "payer": f"{prefix}Who paid{context}? You or your partner?".strip(),
-        "category": f"{prefix}What category is this expense{context}? "
-        f"(e.g. groceries, gas, dining, coffee, utilities)".strip(),
-        "split_payer_pct": (
-            f"{prefix}How should this expense{context} be split? (e.g. 50/50, 70/30, or 100/0)"
-        ).strip(),
-        "split_other_pct": (
-            f"{prefix}How should this expense{context} be split? (e.g. 50/50, 70/30, or 100/0)"
-        ).strip(),
-        "amount": f"{prefix}What was the amount{context}?".strip(),
-    }
-
-    return templates.get(
-        field_name,
-        f"Could you provide the {field_name}{context}?",
-    )
+    prefix = f"For expense #{expense_idx + 1}: " if len(expenses) > 1 else ""
+    template = _QUESTION_TEMPLATES.get(field_name, "Could you provide the {field}{context}?")
+    return prefix + template.format(field=field_name, context=context)
 
 
 def _expenses_to_summary(expenses: list[PendingExpense]) -> str:
@@ -1138,12 +1163,28 @@ def _preserve_original_fields_on_merge(
         if old_exp.amount is not None and new_exp.amount is None:
             updates["amount"] = old_exp.amount
         if updates:
-            result.append(new_exp.model_copy(update=updates))
+            result.append(replace(new_exp, **updates))
         else:
             result.append(new_exp)
     return result
 
 
+# Clarification answers to "who paid?", mapped to canonical payer values.
+_PAYER_ALIASES: dict[str, str] = {
+    "me": "user",
+    "i": "user",
+    "i did": "user",
+    "i paid": "user",
+    "user": "user",
+    "partner": "partner",
+    "my partner": "partner",
+    "they": "partner",
+    "they did": "partner",
+    "they paid": "partner",
+    "them": "partner",
+}
+
+
 def _merge_field_manually(
     expenses: list[PendingExpense],
     field_name: str,
@@ -1155,56 +1196,51 @@ def _merge_field_manually(
 
     Applies the answer to ALL expenses that are missing the given field.
     """
-    answer_stripped = answer.strip().lower()
-
+    answer_stripped = answer.strip().casefold()
+
+    # Interpret the answer once, then apply it to every expense still missing it.
+    updates: dict[str, Any] = {}
+    if field_name == "payer":
+        # Ambiguous answers default to the sender.
+        updates["payer"] = _PAYER_ALIASES.get(answer_stripped, "user")
+
+    elif field_name in ("split_payer_pct", "split_other_pct"):
+        payer_pct, other_pct = _parse_split(answer_stripped)
+        if payer_pct is not None:
+            updates["split_payer_pct"] = payer_pct
+            updates["split_other_pct"] = other_pct
+
+    elif field_name == "category":
+        if answer_stripped:
+            updates["category"] = _normalize_category(answer_stripped, alias_map=alias_map)
+
+    elif field_name == "amount":
+        with contextlib.suppress(ValueError):
+            updates["amount"] = float(answer_stripped.replace(",", ""))
+
+    if not updates:
+        return
     for exp in expenses:
-        if getattr(exp, field_name, "NOT_MISSING") is not None:
-            continue  # Field already filled.
-
-        if field_name == "payer":
-            if answer_stripped in ("me", "i", "i did", "i paid", "user"):
-                exp.payer = "user"
-            elif answer_stripped in ("partner", "they", "they did", "them"):
-                exp.payer = "partner"
-            else:
-                exp.payer = "user"  # Default to user for ambiguous answers.
-
-        elif field_name in ("split_payer_pct", "split_other_pct"):
-            payer_pct, other_pct = _parse_split(answer_stripped)
-            if payer_pct is not None:
-                exp.split_payer_pct = payer_pct
-                exp.split_other_pct = other_pct
+        if getattr(exp, field_name, "NOT_MISSING") is None:
+            for name, value in updates.items():
+                setattr(exp, name, value)
 
-        elif field_name == "category":
-            raw = answer_stripped or None
-            exp.category = _normalize_category(raw, alias_map=alias_map) if raw else None
 
-        elif field_name == "amount":
-            with contextlib.suppress(ValueError):
-                exp.amount = float(answer_stripped.replace(",", ""))
+# Split answers: "50/50", "60 / 40", "33.3/66.7" or a bare payer share ("70", "70%").
+_SPLIT_RE = re.compile(r"\s*(\d+(?:\.\d+)?)\s*/\s*(\d+(?:\.\d+)?)\s*")
+_SPLIT_PCT_RE = re.compile(r"\s*(\d+(?:\.\d+)?)\s*%?\s*")
 
 
 def _parse_split(text: str) -> tuple[float | None, float | None]:
     """Parse a split specification like '50/50' or '70/30'."""
-    text = text.replace(" ", "")
-    if "/" in text:
-        parts = text.split("/")
-        if len(parts) == 2:
-            try:
-                a = float(parts[0])
-                b = float(parts[1])
-                if abs(a + b - 100) < 0.01:
-                    return a, b
-            except ValueError:
-                pass
+    if m := _SPLIT_RE.fullmatch(text):
+        a, b = float(m[1]), float(m[2])
+        if abs(a + b - 100) < 0.01:
+            return a, b
+        return None, None
     # Try percentage-like answers.
-    for word in text.split():
-        try:
-            pct = float(word.rstrip("%"))
-            if 0 <= pct <= 100:
-                return pct, 100 - pct
-        except ValueError:
-            continue
+    if (m := _SPLIT_PCT_RE.fullmatch(text)) and (pct := float(m[1])) <= 100:
+        return pct, 100 - pct
     return None, None
 
 
@@ -1378,9 +1414,8 @@ def _should_override_event_date(
     """Decide whether to override a parsed date with a relative date."""
     if not current_value:
         return True
-    try:
-        parsed = datetime.strptime(current_value, "%Y-%m-%d").date()
-    except ValueError:
+    parsed = _parse_iso_date(current_value)
+    if parsed is None:
         return True
     return abs((parsed - relative_date).days) > 366
 
@@ -1486,6 +1521,18 @@ def _postprocess_settlement(text: str, settlement_data: dict[str, Any]) -> None:
         settlement_data["notes"] = notes
 
 
+def _small_talk_reply(text: str) -> str | None:
+    """Return a canned reply if *text* is only a greeting or a thank-you."""
+    normalized = text.strip().lower()
+    if len(normalized) > _SMALL_TALK_MAX_LEN:
+        return None
+    if _GREETING_RE.fullmatch(normalized):
+        return _GREETING_REPLY
+    if _THANKS_RE.fullmatch(normalized):
+        return _THANKS_REPLY
+    return None
+
+
 def _looks_like_settlement(text: str) -> bool:
     """Heuristic: detect partner-to-partner payments."""
     lowered = text.lower()
@@ -1522,19 +1569,30 @@ def _looks_like_query(text: str) -> bool:
     return bool(re.search(r"\brecent|last\s+few|latest\b", lowered))
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_iso_date(date_str: str) -> date | None:
+    """Parse a ``YYYY-MM-DD`` string, returning ``None`` if it is invalid.
+
+    Cached: the same handful of date strings are re-parsed at every
+    validate, confirm and commit step of a conversation.
+    """
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
 def _normalize_event_date_year(date_str: str | None) -> str | None:
     """If date_str is YYYY-MM-DD with year 2023 but current year is not 2023,
     return the same month/day with current year so approval/commit show correct year.
     """
     if not date_str or not date_str.strip():
         return date_str
-    try:
-        d = datetime.strptime(date_str.strip(), "%Y-%m-%d").date()
+    d = _parse_iso_date(date_str.strip())
+    if d is not None and d.year == 2023:
         today = date.today()
-        if d.year == 2023 and today.year != 2023:
+        if today.year != 2023:
             return date(today.year, d.month, d.day).isoformat()
-    except ValueError:
-        pass
     return date_str
 
 
@@ -1543,10 +1601,7 @@ def _resolve_date(date_str: str | None) -> date:
     if not date_str:
         return date.today()
     normalized = _normalize_event_date_year(date_str) or date_str
-    try:
-        return datetime.strptime(normalized, "%Y-%m-%d").date()
-    except ValueError:
-        return date.today()
+    return _parse_iso_date(normalized) or date.today()
 
 
 async def _resolve_payer_id(
@@ -8,18 +8,33 @@ Provides:
 - :class:`ConversationState` — enum of states in the agent state machine.
 - :class:`ConversationContext` — the full per-user conversation context
   (current state, pending expenses, which field is being clarified, etc.).
-- :class:`ConversationStore` — in-memory dict-based store keyed by Telegram
-  user ID.  Acceptable for the 2-user MVP; if the bot restarts, users
-  simply re-send their message.
+- :class:`AbstractConversationStore` — the store interface used by the
+  orchestrator and bot handlers, including a per-user lock.
+- :class:`ConversationStore` — bounded in-memory store keyed by Telegram
+  user ID (LRU eviction plus an idle TTL).  Acceptable for the 2-user MVP;
+  if the bot restarts, users simply re-send their message.
+- :class:`RedisConversationStore` — Redis-backed store that survives
+  restarts and can be shared by several bot processes.
+- :func:`get_conversation_store` — the process-wide store selected by
+  ``settings.state_backend``, built on first use.
 """
 
 from __future__ import annotations
 
+import asyncio
+import operator
+import time
 import uuid
+import weakref
+from collections import OrderedDict
+from contextlib import AbstractAsyncContextManager
+from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import Any
+from typing import Any, Protocol
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+from finbot.config import settings
 
 # ── Conversation states ───────────────────────────────────────────────────────
 
@@ -38,81 +53,95 @@ class ConversationState(StrEnum):
 # ── Pending expense model ─────────────────────────────────────────────────────
 
 # Fields that must be non-None before an expense can be committed.
-REQUIRED_EXPENSE_FIELDS: list[str] = [
+REQUIRED_EXPENSE_FIELDS: tuple[str, ...] = (
     "amount",
     "category",
     "payer",
     "split_payer_pct",
     "split_other_pct",
-]
+)
+
+# Fetches all required field values in one C-level call, in the order above.
+_required_values = operator.attrgetter(*REQUIRED_EXPENSE_FIELDS)
 
 
-class PendingExpense(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class PendingExpense:
     """A single expense being assembled through the conversation flow.
 
     Fields start as ``None`` (except defaults) and are populated as the LLM
     parses the user's input and clarification answers fill in gaps.
+
+    A plain slotted dataclass: several are built and copied per agent turn,
+    and untrusted input is validated once, in :meth:`from_parsed`.
     """
 
-    amount: float | None = Field(
-        default=None,
-        description="Expense amount as a positive number.",
-    )
-    currency: str = Field(
-        default="ILS",
-        description="Three-letter currency code.",
-    )
-    category: str | None = Field(
-        default=None,
-        description="Expense category (e.g. 'groceries', 'gas').",
-    )
-    description: str | None = Field(
-        default=None,
-        description="Brief description of the expense.",
-    )
-    payer: str | None = Field(
-        default=None,
-        description="Who paid: 'user' or 'partner'.",
-    )
-    split_payer_pct: float | None = Field(
-        default=None,
-        description="Payer's share as a percentage (0-100).",
-    )
-    split_other_pct: float | None = Field(
-        default=None,
-        description="Other partner's share as a percentage (0-100).",
-    )
-    event_date: str | None = Field(
-        default=None,
-        description="Date in YYYY-MM-DD format.  None means today.",
-    )
-    notes: list[str] = Field(
-        default_factory=list,
-        description="Notes about any automatic corrections or assumptions.",
-    )
+    #: Expense amount as a positive number.
+    amount: float | None = None
+    #: Three-letter currency code.
+    currency: str = "ILS"
+    #: Expense category (e.g. 'groceries', 'gas').
+    category: str | None = None
+    #: Brief description of the expense.
+    description: str | None = None
+    #: Who paid: 'user' or 'partner'.
+    payer: str | None = None
+    #: Payer's share as a percentage (0-100).
+    split_payer_pct: float | None = None
+    #: Other partner's share as a percentage (0-100).
+    split_other_pct: float | None = None
+    #: Date in YYYY-MM-DD format.  None means today.
+    event_date: str | None = None
+    #: Notes about any automatic corrections or assumptions.
+    notes: list[str] = field(default_factory=list)
 
     def missing_fields(self) -> list[str]:
         """Return a list of required field names that are still ``None``."""
-        missing: list[str] = []
-        for field_name in REQUIRED_EXPENSE_FIELDS:
-            if getattr(self, field_name) is None:
-                missing.append(field_name)
-        return missing
+        return [
+            name
+            for name, value in zip(REQUIRED_EXPENSE_FIELDS, _required_values(self), strict=True)
+            if value is None
+        ]
+
+    def first_missing_field(self) -> str | None:
+        """Return the first required field that is still ``None``, if any."""
+        for name, value in zip(REQUIRED_EXPENSE_FIELDS, _required_values(self), strict=True):
+            if value is None:
+                return name
+        return None
 
     def is_complete(self) -> bool:
         """Return ``True`` if all required fields have values."""
-        return len(self.missing_fields()) == 0
+        return None not in _required_values(self)
 
     @classmethod
     def from_parsed(cls, data: dict[str, Any]) -> PendingExpense:
         """Build a :class:`PendingExpense` from an LLM-parsed dict.
 
+        Values are validated and coerced (e.g. ``"300"`` → ``300.0``).
         Unknown keys are silently ignored so the LLM can return extra fields
         without breaking things.
+
+        Raises:
+            pydantic.ValidationError: If a known field has an invalid value.
+        """
+        return _PENDING_EXPENSE_ADAPTER.validate_python(data)
+
+    @classmethod
+    def from_parsed_many(cls, items: list[dict[str, Any]]) -> list[PendingExpense]:
+        """Build several expenses in one validation pass.
+
+        Equivalent to ``[PendingExpense.from_parsed(d) for d in items]`` but
+        makes a single call into the validator for the whole list.
+
+        Raises:
+            pydantic.ValidationError: If any item has an invalid value.
         """
-        known_fields = cls.model_fields.keys()
-        filtered = {k: v for k, v in data.items() if k in known_fields}
-        return cls(**filtered)
+        return _PENDING_EXPENSE_LIST_ADAPTER.validate_python(items)
+
+
+_PENDING_EXPENSE_ADAPTER = TypeAdapter(PendingExpense)
+_PENDING_EXPENSE_LIST_ADAPTER = TypeAdapter(list[PendingExpense])
 
 
 # ── Conversation context ──────────────────────────────────────────────────────
@@ -148,7 +177,8 @@ class ConversationContext(BaseModel):
 
     def all_complete(self) -> bool:
         """Return ``True`` if every pending expense has all required fields."""
-        return all(exp.is_complete() for exp in self.pending_expenses)
+        # Inlined is_complete(): one C-level membership test per expense.
+        return all(None not in _required_values(exp) for exp in self.pending_expenses)
 
     def first_missing(self) -> tuple[int, str] | None:
         """Return ``(expense_index, field_name)`` for the first missing field.
@@ -156,44 +186,221 @@ class ConversationContext(BaseModel):
         Returns ``None`` if everything is complete.
         """
         for i, exp in enumerate(self.pending_expenses):
-            missing = exp.missing_fields()
-            if missing:
-                return (i, missing[0])
+            if (field_name := exp.first_missing_field()) is not None:
+                return (i, field_name)
         return None
 
 
+# ── Store interface ───────────────────────────────────────────────────────────
+
+
+class AbstractConversationStore(Protocol):
+    """Per-user conversation context storage.
+
+    Callers follow a get → mutate → set pattern, so implementations may
+    return copies from :meth:`get`.  Methods are coroutines so network-backed
+    stores never block the event loop.  Every get → mutate → set sequence
+    runs under :meth:`lock` so concurrent updates for one user do not
+    overwrite each other.
+    """
+
+    def lock(self, user_id: int) -> AbstractAsyncContextManager[Any]:
+        """Return a lock serializing *user_id*'s updates (not reentrant)."""
+        ...
+
+    async def get(self, user_id: int) -> ConversationContext:
+        """Return the context for *user_id*, creating a fresh one if absent."""
+        ...
+
+    async def set(self, user_id: int, ctx: ConversationContext) -> None:
+        """Store *ctx* for *user_id*."""
+        ...
+
+    async def clear(self, user_id: int) -> None:
+        """Remove the context for *user_id*, resetting them to IDLE."""
+        ...
+
+    async def has(self, user_id: int) -> bool:
+        """Return ``True`` if *user_id* has an active context."""
+        ...
+
+
 # ── In-memory conversation store ──────────────────────────────────────────────
 
 
 class ConversationStore:
-    """Dict-based in-memory store keyed by Telegram user ID.
+    """Bounded in-memory store keyed by Telegram user ID.
+
+    Entries are kept in least-recently-used order, so both eviction paths
+    are O(1): once *maxsize* users are stored the oldest is dropped, and
+    contexts idle for longer than *ttl* seconds are treated as absent.
 
     Thread-safety is not required — the bot runs on a single asyncio event
-    loop and processes one update per user at a time.
+    loop.  :meth:`lock` only serializes updates within this process.
     """
 
-    def __init__(self) -> None:
-        self._store: dict[int, ConversationContext] = {}
-
-    def get(self, user_id: int) -> ConversationContext:
+    def __init__(self, maxsize: int | None = None, ttl: float | None = None) -> None:
+        self._maxsize = maxsize if maxsize is not None else settings.max_sessions
+        self._ttl = ttl if ttl is not None else settings.session_ttl_s
+        # user_id -> (expiry deadline on the monotonic clock, context)
+        self._store: OrderedDict[int, tuple[float, ConversationContext]] = OrderedDict()
+        # Locks of users with an update in flight; dropped once unused.
+        self._locks: weakref.WeakValueDictionary[int, asyncio.Lock] = weakref.WeakValueDictionary()
+
+    def lock(self, user_id: int) -> asyncio.Lock:
+        """Return the lock serializing *user_id*'s updates, creating it if needed."""
+        lock = self._locks.get(user_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[user_id] = lock
+        return lock
+
+    def _lookup(self, user_id: int) -> ConversationContext | None:
+        """Return the live context for *user_id* and refresh its recency."""
+        entry = self._store.get(user_id)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if entry[0] <= now:
+            del self._store[user_id]
+            return None
+        self._store[user_id] = (now + self._ttl, entry[1])
+        self._store.move_to_end(user_id)
+        return entry[1]
+
+    def _put(self, user_id: int, ctx: ConversationContext) -> None:
+        """Store *ctx* for *user_id*, evicting the least recently used if full."""
+        self._store[user_id] = (time.monotonic() + self._ttl, ctx)
+        self._store.move_to_end(user_id)
+        while len(self._store) > self._maxsize:
+            self._store.popitem(last=False)
+
+    async def get(self, user_id: int) -> ConversationContext:
         """Return the context for *user_id*, creating a fresh one if absent."""
-        if user_id not in self._store:
-            self._store[user_id] = ConversationContext()
-        return self._store[user_id]
+        ctx = self._lookup(user_id)
+        if ctx is None:
+            ctx = ConversationContext()
+            self._put(user_id, ctx)
+        return ctx
 
-    def set(self, user_id: int, ctx: ConversationContext) -> None:
-        """Store *ctx* for *user_id*."""
-        self._store[user_id] = ctx
+    async def set(self, user_id: int, ctx: ConversationContext) -> None:
+        """Store *ctx* for *user_id*, evicting the least recently used if full."""
+        self._put(user_id, ctx)
 
-    def clear(self, user_id: int) -> None:
+    async def clear(self, user_id: int) -> None:
         """Remove the context for *user_id*, resetting them to IDLE."""
         self._store.pop(user_id, None)
 
-    def has(self, user_id: int) -> bool:
+    async def has(self, user_id: int) -> bool:
         """Return ``True`` if *user_id* has an active context."""
-        return user_id in self._store
+        return user_id in self
+
+    def __contains__(self, user_id: int) -> bool:
+        return self._lookup(user_id) is not None
+
+
+# ── Redis conversation store ──────────────────────────────────────────────────
+
+
+class RedisConversationStore:
+    """Redis-backed store, one JSON-encoded context per key with an idle TTL.
+
+    Each method is a single round trip on the asyncio Redis client, so a
+    slow Redis delays only the turn waiting on it.  :meth:`lock` is a Redis
+    lock, so updates are serialized across every bot process sharing the
+    Redis.
+
+    Args:
+        client: A ``redis.asyncio.Redis`` client (or anything with the same
+            ``getex`` / ``setex`` / ``exists`` / ``delete`` / ``lock`` methods).
+        key_prefix: Prefix for every key written by this store.
+        ttl: Seconds of inactivity after which a context expires.
+        lock_timeout: Seconds after which a held lock expires, so a crashed
+            process cannot block a user forever.  Must exceed the longest
+            turn, LLM calls included.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        key_prefix: str = "finbot:ctx:",
+        ttl: int | None = None,
+        lock_timeout: float = 120.0,
+    ) -> None:
+        self._client = client
+        self._prefix = key_prefix
+        self._ttl = ttl if ttl is not None else int(settings.session_ttl_s)
+        self._lock_timeout = lock_timeout
+
+    def _key(self, user_id: int) -> str:
+        return f"{self._prefix}{user_id}"
+
+    def lock(self, user_id: int) -> AbstractAsyncContextManager[Any]:
+        """Return a Redis lock serializing *user_id*'s updates across processes."""
+        return self._client.lock(f"{self._prefix}lock:{user_id}", timeout=self._lock_timeout)
+
+    async def get(self, user_id: int) -> ConversationContext:
+        """Return the context for *user_id*, creating a fresh one if absent."""
+        raw = await self._client.getex(self._key(user_id), ex=self._ttl)
+        if raw is None:
+            ctx = ConversationContext()
+            await self.set(user_id, ctx)
+            return ctx
+        return ConversationContext.model_validate_json(raw)
+
+    async def set(self, user_id: int, ctx: ConversationContext) -> None:
+        """Store *ctx* for *user_id*, resetting its TTL."""
+        await self._client.setex(self._key(user_id), self._ttl, ctx.model_dump_json())
+
+    async def clear(self, user_id: int) -> None:
+        """Remove the context for *user_id*, resetting them to IDLE."""
+        await self._client.delete(self._key(user_id))
+
+    async def has(self, user_id: int) -> bool:
+        """Return ``True`` if *user_id* has an active context."""
+        return bool(await self._client.exists(self._key(user_id)))
+
+
+def create_conversation_store() -> AbstractConversationStore:
+    """Build the store selected by ``settings.state_backend``.
+
+    Raises:
+        RuntimeError: If the Redis backend is selected but the ``redis``
+            extra is not installed.
+        ValueError: If the backend is not ``"memory"`` or ``"redis"``.
+    """
+    if settings.state_backend == "memory":
+        return ConversationStore()
+    if settings.state_backend == "redis":
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            raise RuntimeError(
+                "STATE_BACKEND=redis requires the redis extra: pip install 'finbot[redis]'"
+            ) from None
+
+        return RedisConversationStore(redis.Redis.from_url(settings.redis_url))
+    raise ValueError(f"Unknown state backend: {settings.state_backend}")
 
 
 # ── Module-level singleton ────────────────────────────────────────────────────
+# Built lazily so importing this module never touches the backend.
+
+_conversation_store: AbstractConversationStore | None = None
+
+
+def get_conversation_store() -> AbstractConversationStore:
+    """Return the process-wide store, creating it on first call.
+
+    The bot calls this at startup so a misconfigured backend fails there.
+    """
+    global _conversation_store
+    if _conversation_store is None:
+        _conversation_store = create_conversation_store()
+    return _conversation_store
+
 
-conversation_store = ConversationStore()
+def set_conversation_store(store: AbstractConversationStore | None) -> None:
+    """Override the process-wide store (``None`` rebuilds it on next use)."""
+    global _conversation_store
+    _conversation_store = store
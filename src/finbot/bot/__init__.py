@@ -15,6 +15,8 @@ GitHub-Pages-hosted Mini App can reach it.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 
 from aiohttp import web
@@ -25,6 +27,8 @@ from sqlalchemy import select
 
 from aiogram.types import BotCommand, MenuButtonWebApp, WebAppInfo
 
+from finbot.agent import warmup as warmup_agent
+from finbot.agent.state import get_conversation_store
 from finbot.bot.handlers import router as main_router
 from finbot.bot.middleware import AccessControlMiddleware, DbSessionMiddleware
 from finbot.bot.tunnel import start_tunnel, stop_tunnel
@@ -115,11 +119,19 @@ async def run_bot() -> None:
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
 
+    # Build the conversation store up front so a misconfigured backend fails
+    # here, with a clear message, rather than on the first user message.
+    get_conversation_store()
+
     bot = create_bot()
     dp = create_dispatcher()
 
+    # LLM warmup runs in the background; kept so shutdown can cancel it.
+    warmup_task: asyncio.Task[None] | None = None
+
     @dp.startup.register
     async def on_startup() -> None:
+        nonlocal warmup_task
         logger.info("FinBot started — polling for updates")
         # Seed default categories into the DB (idempotent).
         await _seed_default_categories()
@@ -134,9 +146,16 @@ async def run_bot() -> None:
         ])
         logger.info("Registered bot commands with Telegram")
         await _set_menu_button_webapp(bot)
+        # Open LLM connections now rather than on the first user message,
+        # without holding up polling while the providers respond.
+        warmup_task = asyncio.create_task(warmup_agent())
 
     @dp.shutdown.register
     async def on_shutdown() -> None:
+        if warmup_task is not None and not warmup_task.done():
+            warmup_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await warmup_task
         logger.info("FinBot shutting down — disposing DB engine")
         await engine.dispose()
 
@@ -263,12 +263,13 @@ async def handle_webapp_data(message: Message, session: AsyncSession) -> None:
         ConversationContext,
         ConversationState,
         PendingExpense,
-        conversation_store,
+        get_conversation_store,
     )
     from finbot.bot.formatters import format_confirmation_summary
     from finbot.bot.keyboards import confirmation_keyboard
 
     user_id = message.from_user.id
+    store = get_conversation_store()
 
     try:
         data = json.loads(message.web_app_data.data)
@@ -295,16 +296,19 @@ async def handle_webapp_data(message: Message, session: AsyncSession) -> None:
         pending_expenses=[expense],
         original_text=message.web_app_data.data,
     )
-    conversation_store.set(user_id, ctx)
-
-    summary = format_confirmation_summary([expense])
-    sent = await message.answer(
-        summary,
-        reply_markup=confirmation_keyboard(),
-    )
+    # Hold the lock until the message ID is stored, so a Confirm press is
+    # only handled once the context is complete.
+    async with store.lock(user_id):
+        await store.set(user_id, ctx)
+
+        summary = format_confirmation_summary([expense])
+        sent = await message.answer(
+            summary,
+            reply_markup=confirmation_keyboard(),
+        )
 
-    ctx.confirmation_message_id = sent.message_id
-    conversation_store.set(user_id, ctx)
+        ctx.confirmation_message_id = sent.message_id
+        await store.set(user_id, ctx)
 
 
 # ── General text handler ──────────────────────────────────────────────────────
@@ -325,23 +329,25 @@ async def handle_text(message: Message, session: AsyncSession) -> None:
     user_id = message.from_user.id
 
     # ── Category rename sub-flow ──────────────────────────────────────
-    from finbot.agent.state import conversation_store as _conv_store
+    from finbot.agent.state import get_conversation_store
 
-    ctx = _conv_store.get(user_id)
-    if ctx.renaming_category is not None:
+    store = get_conversation_store()
+    async with store.lock(user_id):
+        ctx = await store.get(user_id)
         old_name = ctx.renaming_category
+        if old_name is not None:
+            # This message is the answer, so the rename prompt is done.
+            ctx.renaming_category = None
+            await store.set(user_id, ctx)
+
+    if old_name is not None:
         new_name = message.text.strip()
 
         # Handle cancel commands.
         if new_name.lower() in ("/cancel", "cancel"):
-            ctx.renaming_category = None
-            _conv_store.set(user_id, ctx)
             await message.answer("Rename cancelled.")
             return
 
-        ctx.renaming_category = None
-        _conv_store.set(user_id, ctx)
-
         if not new_name:
             await message.answer("Rename cancelled — empty name.")
             return
@@ -394,11 +400,7 @@ async def handle_text(message: Message, session: AsyncSession) -> None:
 
     # Store the confirmation message ID so callbacks can edit it later.
     if result.keyboard is not None:
-        from finbot.agent.state import conversation_store
-
-        ctx = conversation_store.get(user_id)
-        ctx.confirmation_message_id = sent.message_id
-        conversation_store.set(user_id, ctx)
+        await _remember_confirmation_message(user_id, sent.message_id)
 
 
 # ── Callback query handler ───────────────────────────────────────────────────
@@ -432,11 +434,13 @@ async def handle_callback(
 
     if callback_data.startswith(CB_RENAME_CAT):
         cat_name = callback_data[len(CB_RENAME_CAT) :]
-        from finbot.agent.state import conversation_store as _conv_store
+        from finbot.agent.state import get_conversation_store
 
-        ctx = _conv_store.get(user_id)
-        ctx.renaming_category = cat_name
-        _conv_store.set(user_id, ctx)
+        store = get_conversation_store()
+        async with store.lock(user_id):
+            ctx = await store.get(user_id)
+            ctx.renaming_category = cat_name
+            await store.set(user_id, ctx)
 
         await callback_query.answer()
         if callback_query.message:
@@ -486,16 +490,23 @@ async def handle_callback(
 
         # Store new confirmation message ID if a keyboard was sent.
         if result.keyboard is not None:
-            from finbot.agent.state import conversation_store
-
-            ctx = conversation_store.get(user_id)
-            ctx.confirmation_message_id = sent.message_id
-            conversation_store.set(user_id, ctx)
+            await _remember_confirmation_message(user_id, sent.message_id)
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 
+async def _remember_confirmation_message(user_id: int, message_id: int) -> None:
+    """Record the confirmation message ID in the user's context."""
+    from finbot.agent.state import get_conversation_store
+
+    store = get_conversation_store()
+    async with store.lock(user_id):
+        ctx = await store.get(user_id)
+        ctx.confirmation_message_id = message_id
+        await store.set(user_id, ctx)
+
+
 async def _log_llm_responses(
     session: AsyncSession,
     result: OrchestratorResult,
@@ -80,7 +80,7 @@ async def handle_expense_submit(request: web.Request) -> web.Response:
         ConversationContext,
         ConversationState,
         PendingExpense,
-        conversation_store,
+        get_conversation_store,
     )
     from finbot.bot.formatters import format_confirmation_summary
     from finbot.bot.keyboards import confirmation_keyboard
@@ -146,17 +146,21 @@ async def handle_expense_submit(request: web.Request) -> web.Response:
         pending_expenses=[expense],
         original_text=json.dumps(expense_data),
     )
-    conversation_store.set(user_id, ctx)
-
-    summary = format_confirmation_summary([expense])
-    sent = await bot.send_message(
-        chat_id=user_id,
-        text=summary,
-        reply_markup=confirmation_keyboard(),
-        parse_mode="HTML",
-    )
-    ctx.confirmation_message_id = sent.message_id
-    conversation_store.set(user_id, ctx)
+    # Hold the lock until the message ID is stored, so a Confirm press is
+    # only handled once the context is complete.
+    store = get_conversation_store()
+    async with store.lock(user_id):
+        await store.set(user_id, ctx)
+
+        summary = format_confirmation_summary([expense])
+        sent = await bot.send_message(
+            chat_id=user_id,
+            text=summary,
+            reply_markup=confirmation_keyboard(),
+            parse_mode="HTML",
+        )
+        ctx.confirmation_message_id = sent.message_id
+        await store.set(user_id, ctx)
 
     return web.json_response({"ok": True}, headers=cors)
 
@@ -82,6 +82,13 @@ class Settings(BaseSettings):
         default="claude-3-5-haiku-latest",
         description="Model name for the fallback provider.",
     )
+    fallback_hedge_delay: float | None = Field(
+        default=None,
+        description=(
+            "Seconds to wait for Ollama before also starting the fallback request; "
+            "the first successful reply wins. Unset: fall back only on Ollama failure."
+        ),
+    )
     anthropic_api_key: str = Field(
         default="",
         description="Anthropic API key (required if fallback_llm_provider='anthropic').",
@@ -148,6 +155,24 @@ class Settings(BaseSettings):
         description="Request a specific localtunnel subdomain for a stable URL.",
     )
 
+    # ── Conversation state ────────────────────────────────────────────
+    state_backend: str = Field(
+        default="memory",
+        description="Conversation state backend: 'memory' or 'redis'.",
+    )
+    redis_url: str = Field(
+        default="redis://localhost:6379/0",
+        description="Redis connection URL (used when state_backend='redis').",
+    )
+    max_sessions: int = Field(
+        default=1000,
+        description="Maximum in-flight conversations kept in memory (LRU-evicted).",
+    )
+    session_ttl_s: float = Field(
+        default=3600.0,
+        description="Seconds of inactivity after which a conversation is dropped.",
+    )
+
     # ── General ───────────────────────────────────────────────────────
     default_currency: str = Field(
         default="ILS",
@@ -0,0 +1,29 @@
+"""Primary-key generation for ledger tables.
+
+Provides :func:`uuid7`, a time-ordered UUID (RFC 9562, version 7) used as
+the default primary key for every table.  Unlike random ``uuid4`` keys,
+consecutive rows get increasing keys, so inserts append to the end of the
+primary-key B-tree instead of landing on random pages.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """Return a new version-7 UUID.
+
+    Layout: 48-bit Unix timestamp in milliseconds, then 74 random bits
+    (around the 4 version and 2 variant bits).  IDs created within the same
+    millisecond are unique but not ordered among themselves.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10))
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80 | rand
+    # Overwrite the version (bits 76-79) and variant (bits 62-63) fields.
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
@@ -1,8 +1,9 @@
 """SQLAlchemy ORM models for the FinBot database.
 
 Maps the schema defined in docs/design.md §6 to SQLAlchemy 2.x declarative
-models.  All tables use UUID primary keys, TIMESTAMPTZ timestamps, and
-DECIMAL for monetary values.
+models.  All tables use time-ordered UUID primary keys (see
+:mod:`finbot.ledger.ids`), TIMESTAMPTZ timestamps, and DECIMAL for
+monetary values.
 """
 
 import uuid
@@ -25,6 +26,8 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
+from finbot.ledger.ids import uuid7
+
 
 class Base(DeclarativeBase):
     """Shared declarative base for all FinBot models."""
@@ -38,7 +41,7 @@ class RawInput(Base):
 
     __tablename__ = "raw_inputs"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     telegram_user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     raw_text: Mapped[str] = mapped_column(Text, nullable=False)
     created_at: Mapped[datetime] = mapped_column(nullable=False, server_default=func.now())
@@ -54,7 +57,7 @@ class LedgerEntry(Base):
 
     __tablename__ = "ledger"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     raw_input_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("raw_inputs.id"), nullable=False
     )
@@ -118,7 +121,7 @@ class Partnership(Base):
 
     __tablename__ = "partnerships"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_a_telegram_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     user_b_telegram_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     default_currency: Mapped[str] = mapped_column(Text, nullable=False, server_default="ILS")
@@ -141,7 +144,7 @@ class LLMCall(Base):
 
     __tablename__ = "llm_calls"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     provider: Mapped[str] = mapped_column(Text, nullable=False)
     model: Mapped[str] = mapped_column(Text, nullable=False)
     input_tokens: Mapped[int | None] = mapped_column(Integer, nullable=True)
@@ -163,7 +166,7 @@ class FailureLog(Base):
 
     __tablename__ = "failure_log"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     telegram_user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
     user_input: Mapped[str] = mapped_column(Text, nullable=False)
     error_reply: Mapped[str] = mapped_column(Text, nullable=False)
@@ -203,6 +203,28 @@ async def save_ledger_entry(
     return entry
 
 
+async def save_ledger_entries(
+    session: AsyncSession,
+    entries: list[LedgerEntry],
+) -> list[LedgerEntry]:
+    """Commit several ledger entries with a single flush.
+
+    Used when one confirmation covers multiple expenses, so the INSERTs go
+    out in one unit-of-work flush instead of one per entry.
+
+    Args:
+        session: Active async database session (caller manages commit).
+        entries: Unsaved :class:`LedgerEntry` instances.
+
+    Returns:
+        The same entries (with ``id`` populated after flush).
+    """
+    if entries:
+        session.add_all(entries)
+        await session.flush()
+    return entries
+
+
 # ── Query functions (Phase 5) ────────────────────────────────────────────────
 
 
@@ -11,7 +11,7 @@ The registry stores :class:`ToolDef` descriptors and provides methods to:
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterable
 from dataclasses import dataclass
 from typing import Any
 
@@ -125,6 +125,26 @@ class ToolRegistry:
         )
         logger.debug("Registered tool: %s", name)
 
+    def register_many(self, tools: Iterable[ToolDef]) -> None:
+        """Register several prebuilt tool definitions in one batch.
+
+        The batch is all-or-nothing: if any name is already registered or
+        repeated within *tools*, nothing is added.
+
+        Args:
+            tools: Tool definitions to add.
+
+        Raises:
+            ValueError: If a tool name is already registered or duplicated.
+        """
+        batch: dict[str, ToolDef] = {}
+        for tool_def in tools:
+            if tool_def.name in self._tools or tool_def.name in batch:
+                raise ValueError(f"Tool '{tool_def.name}' is already registered")
+            batch[tool_def.name] = tool_def
+        self._tools.update(batch)
+        logger.debug("Registered tools: %s", ", ".join(batch))
+
     def get_tool(self, name: str) -> ToolDef | None:
         """Look up a tool by name.
 
@@ -94,8 +94,11 @@ async def log_settlement(
     payer_id = user_id if payer == "user" else partner_id
     dec_amount = Decimal(str(amount))
 
-    # Validate.
-    current_balance = await _derive_balance(session, user_id, partner_id)
+    # Validate.  The balance only feeds the overpayment warning, which is
+    # skipped for non-positive amounts, so don't replay the ledger for them.
+    current_balance = (
+        await _derive_balance(session, user_id, partner_id) if dec_amount > 0 else None
+    )
     errors = _validate(
         amount=dec_amount,
         payer_telegram_id=payer_id,
@@ -199,7 +202,9 @@ async def validate_settlement_tool(
     payer_id = user_id if payer == "user" else partner_id
     dec_amount = Decimal(str(amount))
 
-    current_balance = await _derive_balance(session, user_id, partner_id)
+    current_balance = (
+        await _derive_balance(session, user_id, partner_id) if dec_amount > 0 else None
+    )
     errors = _validate(
         amount=dec_amount,
         payer_telegram_id=payer_id,
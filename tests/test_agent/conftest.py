@@ -0,0 +1,35 @@
+"""Shared fixtures for agent tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from unittest.mock import AsyncMock
+
+import pytest
+
+from finbot.agent.llm_client import LLMResponse
+from finbot.agent.orchestrator import Orchestrator
+from finbot.agent.state import ConversationStore
+
+
+@pytest.fixture
+def store() -> ConversationStore:
+    """A fresh, empty conversation store."""
+    return ConversationStore()
+
+
+@pytest.fixture
+def orch_factory(store: ConversationStore) -> Callable[..., tuple[Orchestrator, AsyncMock]]:
+    """Build an Orchestrator on the test's ``store`` with a mocked LLM client.
+
+    Call with an optional :class:`LLMResponse` for ``chat`` to return;
+    returns ``(orchestrator, mock_llm)``.
+    """
+
+    def factory(llm_response: LLMResponse | None = None) -> tuple[Orchestrator, AsyncMock]:
+        mock_llm = AsyncMock()
+        if llm_response is not None:
+            mock_llm.chat = AsyncMock(return_value=llm_response)
+        return Orchestrator(llm_client=mock_llm, store=store), mock_llm
+
+    return factory
@@ -3,15 +3,18 @@
 Tests cover:
 - OllamaLLMClient with mocked Ollama async client
 - PaidLLMClient with mocked Anthropic and OpenAI SDKs
-- FallbackLLMClient composite behavior (primary → fallback)
+- FallbackLLMClient composite behavior (primary → fallback, hedging)
 - Response parsing and tool call extraction
 - Format conversion helpers
 """
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 
 from finbot.agent.llm_client import (
@@ -23,6 +26,8 @@ from finbot.agent.llm_client import (
     ToolCall,
     _estimate_cost_usd,
     _messages_to_ollama,
+    _parse_arguments,
+    _rates,
     _tools_to_anthropic,
 )
 
@@ -63,6 +68,14 @@ def test_messages_to_ollama() -> None:
     assert result[1] == {"role": "user", "content": "Hello"}
 
 
+def test_messages_to_ollama_handles_subclasses() -> None:
+    class TaggedMessage(ChatMessage):
+        pass
+
+    result = _messages_to_ollama([TaggedMessage(role="user", content="Hi")])
+    assert result == [{"role": "user", "content": "Hi"}]
+
+
 def test_tools_to_anthropic() -> None:
     tools = [
         {
@@ -86,12 +99,27 @@ def test_tools_to_anthropic_empty() -> None:
     assert _tools_to_anthropic([]) == []
 
 
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ('{"text": "groceries 300"}', {"text": "groceries 300"}),
+        (b'{"a": 1}', {"a": 1}),
+        ({"a": 1}, {"a": 1}),
+        (None, {}),
+        ("", {}),
+        ("{not json", {}),
+        ("[1, 2]", {}),
+    ],
+)
+def test_parse_arguments(raw: object, expected: dict[str, object]) -> None:
+    """Tool-call arguments should always come back as a dict."""
+    assert _parse_arguments(raw) == expected
+
+
 # ── Cost estimation ───────────────────────────────────────────────────────────
 
 
 def test_estimate_cost_ollama_is_zero() -> None:
-    from decimal import Decimal
-
     cost = _estimate_cost_usd("ollama", "qwen2.5", 100, 50)
     assert cost == Decimal("0")
 
@@ -108,18 +136,68 @@ def test_estimate_cost_gpt4o_mini() -> None:
     assert cost > 0
 
 
+def test_estimate_cost_decimal_equals_microcents() -> None:
+    """Integer pricing should agree with the per-1M-token dollar rates."""
+    haiku = _estimate_cost_usd("anthropic", "claude-3-5-haiku-latest", 1000, 500)
+    legacy = (Decimal(1000) * Decimal("0.25") + Decimal(500) * Decimal("1.25")) / 1_000_000
+    assert haiku == legacy == Decimal("0.000875")
+
+    mini = _estimate_cost_usd("openai", "gpt-4o-mini", 1000, 500)
+    assert mini == Decimal("0.00045")
+
+
+def test_estimate_cost_rates_cached() -> None:
+    _rates.cache_clear()
+    _estimate_cost_usd("anthropic", "claude-3-5-haiku-latest", 10, 10)
+    _estimate_cost_usd("anthropic", "claude-3-5-haiku-latest", 20, 20)
+    assert _rates.cache_info().hits > 0
+
+
 def test_estimate_cost_unknown_model() -> None:
     cost = _estimate_cost_usd("other", "unknown-model", 1000, 500)
     assert cost is None
 
 
+# ── SDK mock fixtures ─────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def ollama_mock(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Patch ``ollama.AsyncClient`` and return the client instance mock."""
+    instance = AsyncMock()
+    monkeypatch.setattr("ollama.AsyncClient", MagicMock(return_value=instance))
+    return instance
+
+
+@pytest.fixture
+def anthropic_mock(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Patch ``anthropic.AsyncAnthropic`` and return the client instance mock."""
+    instance = AsyncMock()
+    monkeypatch.setattr("anthropic.AsyncAnthropic", MagicMock(return_value=instance))
+    return instance
+
+
+@pytest.fixture
+def openai_mock(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Patch ``openai.AsyncOpenAI`` and return the client instance mock."""
+    instance = AsyncMock()
+    monkeypatch.setattr("openai.AsyncOpenAI", MagicMock(return_value=instance))
+    return instance
+
+
+@pytest.fixture
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip retry backoff sleeps."""
+    monkeypatch.setattr("finbot.agent.llm_client._sleep", AsyncMock())
+
+
 # ── OllamaLLMClient tests ────────────────────────────────────────────────────
 
 
 @pytest.mark.asyncio
-async def test_ollama_client_basic_response() -> None:
+async def test_ollama_client_basic_response(ollama_mock: AsyncMock) -> None:
     """OllamaLLMClient should parse a basic text response from Ollama."""
-    mock_response = {
+    ollama_mock.chat.return_value = {
         "message": {
             "content": "Hello! How can I help?",
             "tool_calls": None,
@@ -128,15 +206,10 @@ async def test_ollama_client_basic_response() -> None:
         "eval_count": 20,
     }
 
-    with patch("ollama.AsyncClient") as mock_ollama_cls:
-        instance = AsyncMock()
-        instance.chat = AsyncMock(return_value=mock_response)
-        mock_ollama_cls.return_value = instance
-
-        client = OllamaLLMClient(base_url="http://test:11434", model="test-model")
-        messages = [ChatMessage(role="user", content="hi")]
+    client = OllamaLLMClient(base_url="http://test:11434", model="test-model")
+    messages = [ChatMessage(role="user", content="hi")]
 
-        result = await client.chat(messages)
+    result = await client.chat(messages)
 
     assert result.content == "Hello! How can I help?"
     assert result.tool_calls == []
@@ -145,12 +218,13 @@ async def test_ollama_client_basic_response() -> None:
     assert result.provider == "ollama"
     assert result.model == "test-model"
     assert result.latency_ms is not None
+    assert isinstance(result.latency_ms, int)
 
 
 @pytest.mark.asyncio
-async def test_ollama_client_with_tool_calls() -> None:
+async def test_ollama_client_with_tool_calls(ollama_mock: AsyncMock) -> None:
     """OllamaLLMClient should parse tool calls from the response."""
-    mock_response = {
+    ollama_mock.chat.return_value = {
         "message": {
             "content": "",
             "tool_calls": [
@@ -166,26 +240,101 @@ async def test_ollama_client_with_tool_calls() -> None:
         "eval_count": 30,
     }
 
-    with patch("ollama.AsyncClient") as mock_ollama_cls:
-        instance = AsyncMock()
-        instance.chat = AsyncMock(return_value=mock_response)
-        mock_ollama_cls.return_value = instance
+    client = OllamaLLMClient(base_url="http://test:11434", model="test-model")
+    messages = [ChatMessage(role="user", content="groceries 300")]
 
-        client = OllamaLLMClient(base_url="http://test:11434", model="test-model")
-        messages = [ChatMessage(role="user", content="groceries 300")]
-
-        result = await client.chat(messages)
+    result = await client.chat(messages)
 
     assert len(result.tool_calls) == 1
     assert result.tool_calls[0].name == "parse_expense"
     assert result.tool_calls[0].arguments == {"text": "groceries 300"}
 
 
+@pytest.mark.asyncio
+async def test_ollama_client_tool_call_arguments_as_json_string(
+    ollama_mock: AsyncMock,
+) -> None:
+    """Tool-call arguments returned as a JSON string should be decoded to a dict."""
+    ollama_mock.chat.return_value = {
+        "message": {
+            "content": "",
+            "tool_calls": [
+                {
+                    "function": {
+                        "name": "parse_expense",
+                        "arguments": '{"text":"groceries 300"}',
+                    }
+                }
+            ],
+        },
+    }
+
+    client = OllamaLLMClient(base_url="http://test:11434", model="test-model")
+    messages = [ChatMessage(role="user", content="groceries 300")]
+
+    result = await client.chat(messages)
+
+    assert result.tool_calls[0].arguments == {"text": "groceries 300"}
+
+
+@pytest.mark.asyncio
+async def test_ollama_retries_on_transient_error(
+    ollama_mock: AsyncMock,
+    no_backoff: None,
+) -> None:
+    """Transient transport errors should be retried before giving up."""
+    ollama_mock.chat.side_effect = [
+        ConnectionError("refused"),
+        httpx.TimeoutException("slow"),
+        {"message": {"content": "ok", "tool_calls": None}},
+    ]
+
+    client = OllamaLLMClient(base_url="http://test:11434", model="test-model")
+    result = await client.chat([ChatMessage(role="user", content="hi")])
+
+    assert result.content == "ok"
+    assert ollama_mock.chat.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_ollama_gives_up_after_max_attempts(
+    ollama_mock: AsyncMock,
+    no_backoff: None,
+) -> None:
+    """The last transient error should propagate once retries are exhausted."""
+    ollama_mock.chat.side_effect = ConnectionError("refused")
+
+    client = OllamaLLMClient(base_url="http://test:11434", model="test-model")
+    with pytest.raises(ConnectionError):
+        await client.chat([ChatMessage(role="user", content="hi")])
+
+    assert ollama_mock.chat.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_ollama_warmup_preloads_model(ollama_mock: AsyncMock) -> None:
+    """warmup() should send one empty chat so Ollama loads the model."""
+    client = OllamaLLMClient(base_url="http://test:11434", model="test-model")
+
+    await client.warmup()
+
+    ollama_mock.chat.assert_awaited_once_with(model="test-model", messages=[])
+
+
+@pytest.mark.asyncio
+async def test_ollama_warmup_swallows_errors(ollama_mock: AsyncMock) -> None:
+    """A failed warmup must not prevent the bot from starting."""
+    ollama_mock.chat.side_effect = ConnectionError("refused")
+    client = OllamaLLMClient(base_url="http://test:11434", model="test-model")
+
+    await client.warmup()
+
+
 # ── PaidLLMClient tests ──────────────────────────────────────────────────────
 
 
 @pytest.mark.asyncio
-async def test_paid_client_anthropic_basic() -> None:
+async def test_paid_client_anthropic_basic(anthropic_mock: AsyncMock) -> None:
     """PaidLLMClient should handle Anthropic text responses."""
     mock_block = MagicMock()
     mock_block.type = "text"
@@ -195,28 +344,32 @@ async def test_paid_client_anthropic_basic() -> None:
     mock_response.content = [mock_block]
     mock_response.usage.input_tokens = 80
     mock_response.usage.output_tokens = 15
+    anthropic_mock.messages.create.return_value = mock_response
 
-    with patch("anthropic.AsyncAnthropic") as mock_anthropic_cls:
-        mock_client = AsyncMock()
-        mock_client.messages.create = AsyncMock(return_value=mock_response)
-        mock_anthropic_cls.return_value = mock_client
-
-        client = PaidLLMClient(provider="anthropic", model="claude-3-5-haiku-latest")
-        messages = [
-            ChatMessage(role="system", content="You are helpful."),
-            ChatMessage(role="user", content="groceries 300"),
-        ]
+    client = PaidLLMClient(provider="anthropic", model="claude-3-5-haiku-latest")
+    messages = [
+        ChatMessage(role="system", content="You are helpful."),
+        ChatMessage(role="user", content="groceries 300"),
+    ]
 
-        result = await client.chat(messages)
+    result = await client.chat(messages)
 
     assert result.content == "Parsed your expense."
     assert result.input_tokens == 80
     assert result.output_tokens == 15
     assert result.provider == "anthropic"
+    system = anthropic_mock.messages.create.call_args.kwargs["system"]
+    assert system == [
+        {
+            "type": "text",
+            "text": "You are helpful.",
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
 
 
 @pytest.mark.asyncio
-async def test_paid_client_anthropic_tool_use() -> None:
+async def test_paid_client_anthropic_tool_use(anthropic_mock: AsyncMock) -> None:
     """PaidLLMClient should parse Anthropic tool_use blocks."""
     mock_text_block = MagicMock()
     mock_text_block.type = "text"
@@ -232,16 +385,12 @@ async def test_paid_client_anthropic_tool_use() -> None:
     mock_response.content = [mock_text_block, mock_tool_block]
     mock_response.usage.input_tokens = 100
     mock_response.usage.output_tokens = 40
+    anthropic_mock.messages.create.return_value = mock_response
 
-    with patch("anthropic.AsyncAnthropic") as mock_anthropic_cls:
-        mock_client = AsyncMock()
-        mock_client.messages.create = AsyncMock(return_value=mock_response)
-        mock_anthropic_cls.return_value = mock_client
-
-        client = PaidLLMClient(provider="anthropic", model="claude-3-5-haiku-latest")
-        messages = [ChatMessage(role="user", content="groceries 300")]
+    client = PaidLLMClient(provider="anthropic", model="claude-3-5-haiku-latest")
+    messages = [ChatMessage(role="user", content="groceries 300")]
 
-        result = await client.chat(messages)
+    result = await client.chat(messages)
 
     assert len(result.tool_calls) == 1
     assert result.tool_calls[0].id == "toolu_123"
@@ -250,7 +399,7 @@ async def test_paid_client_anthropic_tool_use() -> None:
 
 
 @pytest.mark.asyncio
-async def test_paid_client_openai_basic() -> None:
+async def test_paid_client_openai_basic(openai_mock: AsyncMock) -> None:
     """PaidLLMClient should handle OpenAI text responses."""
     mock_choice = MagicMock()
     mock_choice.message.content = "Here's your expense."
@@ -260,16 +409,12 @@ async def test_paid_client_openai_basic() -> None:
     mock_response.choices = [mock_choice]
     mock_response.usage.prompt_tokens = 60
     mock_response.usage.completion_tokens = 10
+    openai_mock.chat.completions.create.return_value = mock_response
 
-    with patch("openai.AsyncOpenAI") as mock_openai_cls:
-        mock_client = AsyncMock()
-        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
-        mock_openai_cls.return_value = mock_client
-
-        client = PaidLLMClient(provider="openai", model="gpt-4o-mini")
-        messages = [ChatMessage(role="user", content="hello")]
+    client = PaidLLMClient(provider="openai", model="gpt-4o-mini")
+    messages = [ChatMessage(role="user", content="hello")]
 
-        result = await client.chat(messages)
+    result = await client.chat(messages)
 
     assert result.content == "Here's your expense."
     assert result.input_tokens == 60
@@ -278,13 +423,50 @@ async def test_paid_client_openai_basic() -> None:
 
 
 @pytest.mark.asyncio
-async def test_paid_client_unknown_provider_raises() -> None:
-    """PaidLLMClient should raise ValueError for unknown providers."""
-    client = PaidLLMClient(provider="unknown", model="test")
-    messages = [ChatMessage(role="user", content="hi")]
+async def test_paid_client_openai_missing_usage(openai_mock: AsyncMock) -> None:
+    """A response without usage data should yield ``None`` token counts."""
+    mock_choice = MagicMock()
+    mock_choice.message.content = "ok"
+    mock_choice.message.tool_calls = None
 
+    mock_response = MagicMock()
+    mock_response.choices = [mock_choice]
+    mock_response.usage = None
+    openai_mock.chat.completions.create.return_value = mock_response
+
+    client = PaidLLMClient(provider="openai", model="gpt-4o-mini")
+    result = await client.chat([ChatMessage(role="user", content="hello")])
+
+    assert result.content == "ok"
+    assert result.input_tokens is None
+    assert result.output_tokens is None
+
+
+def test_paid_client_unknown_provider_raises() -> None:
+    """PaidLLMClient should reject unknown providers at construction time."""
     with pytest.raises(ValueError, match="Unknown LLM provider"):
-        await client.chat(messages)
+        PaidLLMClient(provider="unknown", model="test")
+
+
+@pytest.mark.asyncio
+async def test_paid_client_warmup_lists_models(anthropic_mock: AsyncMock) -> None:
+    """warmup() should open the connection with a models.list call."""
+    client = PaidLLMClient(provider="anthropic", model="test")
+
+    await client.warmup()
+
+    anthropic_mock.models.list.assert_awaited_once_with()
+
+
+@pytest.mark.asyncio
+async def test_paid_client_warmup_swallows_errors(openai_mock: AsyncMock) -> None:
+    """A failed warmup must not prevent the bot from starting."""
+    openai_mock.models.list.side_effect = RuntimeError("network down")
+    client = PaidLLMClient(provider="openai", model="test")
+
+    await client.warmup()
+
+    openai_mock.models.list.assert_awaited_once()
 
 
 # ── FallbackLLMClient tests ──────────────────────────────────────────────────
@@ -346,3 +528,74 @@ async def test_fallback_raises_when_both_fail() -> None:
 
     with pytest.raises(RuntimeError, match="API error"):
         await client.chat(messages)
+
+
+@pytest.mark.asyncio
+async def test_fallback_cancels_loser() -> None:
+    """A hedged call should return the first reply and cancel the slow one."""
+    primary_cancelled = asyncio.Event()
+
+    async def slow_chat(*_: object) -> LLMResponse:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            primary_cancelled.set()
+            raise
+        return LLMResponse(content="primary", provider="ollama")
+
+    primary = MagicMock()
+    primary.chat = slow_chat
+    fallback = AsyncMock()
+    fallback.chat = AsyncMock(
+        return_value=LLMResponse(content="fallback ok", provider="anthropic", model="test")
+    )
+
+    client = FallbackLLMClient(primary=primary, fallback=fallback, hedge_delay=0.01)
+    result = await client.chat([ChatMessage(role="user", content="hello")])
+
+    assert result.content == "fallback ok"
+    assert result.provider == "anthropic (fallback)"
+    assert primary_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_fallback_hedge_primary_still_wins() -> None:
+    """A slow primary finishing before the hedged fallback should win."""
+    primary = AsyncMock()
+    primary.chat = AsyncMock(return_value=LLMResponse(content="primary ok", provider="ollama"))
+
+    async def slower_chat(*_: object) -> LLMResponse:
+        await asyncio.sleep(1)
+        return LLMResponse(content="fallback", provider="anthropic")
+
+    fallback = MagicMock()
+    fallback.chat = slower_chat
+
+    client = FallbackLLMClient(primary=primary, fallback=fallback, hedge_delay=0)
+    result = await client.chat([ChatMessage(role="user", content="hello")])
+
+    assert result.content == "primary ok"
+    assert result.provider == "ollama"
+
+
+@pytest.mark.asyncio
+async def test_fallback_warmup_warms_both_clients() -> None:
+    """warmup() should warm the primary and the fallback client."""
+    primary = AsyncMock()
+    fallback = AsyncMock()
+
+    await FallbackLLMClient(primary=primary, fallback=fallback).warmup()
+
+    primary.warmup.assert_awaited_once()
+    fallback.warmup.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_fallback_warmup_skips_client_without_warmup() -> None:
+    """A client without a warmup method should be left alone."""
+    primary = MagicMock(spec_set=["chat"])
+    fallback = AsyncMock()
+
+    await FallbackLLMClient(primary=primary, fallback=fallback).warmup()
+
+    fallback.warmup.assert_awaited_once()
@@ -7,8 +7,11 @@ and cancel.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
+from collections.abc import Callable
 from datetime import date
+from operator import attrgetter
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -20,6 +23,7 @@ from finbot.agent.orchestrator import (
     _merge_field_manually,
     _parse_split,
     _resolve_date,
+    _small_talk_reply,
 )
 from finbot.agent.state import (
     ConversationContext,
@@ -31,6 +35,12 @@ from finbot.bot.keyboards import CB_CANCEL, CB_CONFIRM, CB_EDIT
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# Signature of the ``orch_factory`` fixture from conftest.py.
+OrchestratorFactory = Callable[..., tuple[Orchestrator, AsyncMock]]
+
+# Tests only pass raw_input_id through, so one id serves the whole module.
+_RAW_ID = uuid.uuid4()
+
 
 def _make_llm_response(
     *,
@@ -90,51 +100,40 @@ def _incomplete_expense_dict(**overrides) -> dict:
     return base
 
 
-def _make_orchestrator(
-    llm_response: LLMResponse | None = None,
-    store: ConversationStore | None = None,
-) -> tuple[Orchestrator, AsyncMock]:
-    """Create an Orchestrator with a mocked LLM client."""
-    mock_llm = AsyncMock()
-    if llm_response is not None:
-        mock_llm.chat = AsyncMock(return_value=llm_response)
-    s = store or ConversationStore()
-    return Orchestrator(llm_client=mock_llm, store=s), mock_llm
-
-
 # ── Happy path: parse → validate → confirm → commit ─────────────────────────
 
 
 @pytest.mark.asyncio
-async def test_happy_path_complete_expense() -> None:
+async def test_happy_path_complete_expense(
+    store: ConversationStore, orch_factory: OrchestratorFactory
+) -> None:
     """A message with all fields should go straight to CONFIRMING."""
     response = _make_llm_response(tool_calls=[_expense_tool_call([_complete_expense_dict()])])
-    store = ConversationStore()
-    orch, _ = _make_orchestrator(response, store)
+    orch, _ = orch_factory(response)
     session = AsyncMock()
-    raw_id = uuid.uuid4()
 
     result = await orch.handle_message(
         user_id=42,
         text="groceries 300 I paid split 50/50",
         session=session,
-        raw_input_id=raw_id,
+        raw_input_id=_RAW_ID,
     )
 
     # Should be in CONFIRMING state with a keyboard.
     assert result.keyboard is not None
     assert "groceries" in result.reply_text.lower() or "300" in result.reply_text
-    ctx = store.get(42)
+    ctx = await store.get(42)
     assert ctx.state == ConversationState.CONFIRMING
 
 
 @pytest.mark.asyncio
-async def test_happy_path_confirm_commits() -> None:
+async def test_happy_path_confirm_commits(
+    store: ConversationStore, orch_factory: OrchestratorFactory
+) -> None:
     """Tapping Confirm should write to the ledger and return to IDLE."""
-    store = ConversationStore()
     ctx = ConversationContext(
         state=ConversationState.CONFIRMING,
-        raw_input_id=uuid.uuid4(),
+        raw_input_id=_RAW_ID,
         pending_expenses=[
             PendingExpense(
                 amount=300,
@@ -146,11 +145,10 @@ async def test_happy_path_confirm_commits() -> None:
             ),
         ],
     )
-    store.set(42, ctx)
-    orch, _ = _make_orchestrator(store=store)
+    await store.set(42, ctx)
+    orch, _ = orch_factory()
     session = AsyncMock()
-    session.add = MagicMock()
-    session.flush = AsyncMock()
+    session.add_all = MagicMock()
 
     result = await orch.handle_callback(
         user_id=42,
@@ -161,20 +159,22 @@ async def test_happy_path_confirm_commits() -> None:
     assert "\u2705" in result.reply_text  # Checkmark
     assert "1 expense" in result.reply_text.lower()
     # State should be cleared.
-    assert not store.has(42)
+    assert not await store.has(42)
     # Ledger entry should have been written.
-    session.add.assert_called_once()
+    session.add_all.assert_called_once()
+    assert len(session.add_all.call_args.args[0]) == 1
 
 
 # ── Clarification flow ───────────────────────────────────────────────────────
 
 
 @pytest.mark.asyncio
-async def test_missing_payer_triggers_clarification() -> None:
+async def test_missing_payer_triggers_clarification(
+    store: ConversationStore, orch_factory: OrchestratorFactory
+) -> None:
     """If payer is missing, orchestrator should ask for it."""
     response = _make_llm_response(tool_calls=[_expense_tool_call([_incomplete_expense_dict()])])
-    store = ConversationStore()
-    orch, _ = _make_orchestrator(response, store)
+    orch, _ = orch_factory(response)
     session = AsyncMock()
 
     # Ensure assume_half_split is off so split stays missing.
@@ -187,10 +187,10 @@ async def test_missing_payer_triggers_clarification() -> None:
             user_id=42,
             text="groceries 300",
             session=session,
-            raw_input_id=uuid.uuid4(),
+            raw_input_id=_RAW_ID,
         )
 
-    ctx = store.get(42)
+    ctx = await store.get(42)
     assert ctx.state == ConversationState.CLARIFYING
     assert result.keyboard is None  # No confirm keyboard yet.
     # Should ask about split (payer is auto-defaulted to "user").
@@ -198,19 +198,20 @@ async def test_missing_payer_triggers_clarification() -> None:
 
 
 @pytest.mark.asyncio
-async def test_clarification_answer_merges_and_revalidates() -> None:
+async def test_clarification_answer_merges_and_revalidates(
+    store: ConversationStore, orch_factory: OrchestratorFactory
+) -> None:
     """Answering a clarification should merge data and re-validate."""
-    store = ConversationStore()
     # Set up state: we're clarifying payer.
     ctx = ConversationContext(
         state=ConversationState.CLARIFYING,
-        raw_input_id=uuid.uuid4(),
+        raw_input_id=_RAW_ID,
         clarification_field="payer",
         pending_expenses=[
             PendingExpense(amount=300, category="groceries"),
         ],
     )
-    store.set(42, ctx)
+    await store.set(42, ctx)
 
     # LLM response with payer filled in but still missing split.
     merge_response = _make_llm_response(
@@ -222,7 +223,7 @@ async def test_clarification_answer_merges_and_revalidates() -> None:
             )
         ]
     )
-    orch, mock_llm = _make_orchestrator(merge_response, store)
+    orch, mock_llm = orch_factory(merge_response)
     mock_llm.chat = AsyncMock(return_value=merge_response)
     session = AsyncMock()
 
@@ -236,22 +237,23 @@ async def test_clarification_answer_merges_and_revalidates() -> None:
             user_id=42,
             text="me",
             session=session,
-            raw_input_id=uuid.uuid4(),
+            raw_input_id=_RAW_ID,
         )
 
-    ctx = store.get(42)
+    ctx = await store.get(42)
     # Still needs split — should be in CLARIFYING again.
     assert ctx.state == ConversationState.CLARIFYING
     assert "split" in result.reply_text.lower()
 
 
 @pytest.mark.asyncio
-async def test_full_clarification_flow_to_confirm() -> None:
+async def test_full_clarification_flow_to_confirm(
+    store: ConversationStore, orch_factory: OrchestratorFactory
+) -> None:
     """After all clarifications answered, should reach CONFIRMING."""
-    store = ConversationStore()
     ctx = ConversationContext(
         state=ConversationState.CLARIFYING,
-        raw_input_id=uuid.uuid4(),
+        raw_input_id=_RAW_ID,
         clarification_field="payer",
         pending_expenses=[
             PendingExpense(
@@ -262,11 +264,11 @@ async def test_full_clarification_flow_to_confirm() -> None:
             ),
         ],
     )
-    store.set(42, ctx)
+    await store.set(42, ctx)
 
     # LLM returns complete data.
     merge_response = _make_llm_response(tool_calls=[_expense_tool_call([_complete_expense_dict()])])
-    orch, mock_llm = _make_orchestrator(merge_response, store)
+    orch, mock_llm = orch_factory(merge_response)
     mock_llm.chat = AsyncMock(return_value=merge_response)
     session = AsyncMock()
 
@@ -274,10 +276,10 @@ async def test_full_clarification_flow_to_confirm() -> None:
         user_id=42,
         text="me",
         session=session,
-        raw_input_id=uuid.uuid4(),
+        raw_input_id=_RAW_ID,
     )
 
-    ctx = store.get(42)
+    ctx = await store.get(42)
     assert ctx.state == ConversationState.CONFIRMING
     assert result.keyboard is not None
 
@@ -286,14 +288,15 @@ async def test_full_clarification_flow_to_confirm() -> None:
 
 
 @pytest.mark.asyncio
-async def test_cancel_clears_state() -> None:
+async def test_cancel_clears_state(
+    store: ConversationStore, orch_factory: OrchestratorFactory
+) -> None:
     """Tapping Cancel should discard pending expenses."""
-    store = ConversationStore()
-    store.set(
+    await store.set(
         42,
         ConversationContext(
             state=ConversationState.CONFIRMING,
-            raw_input_id=uuid.uuid4(),
+            raw_input_id=_RAW_ID,
             pending_expenses=[
                 PendingExpense(
                     amount=300,
@@ -305,7 +308,7 @@ async def test_cancel_clears_state() -> None:
             ],
         ),
     )
-    orch, _ = _make_orchestrator(store=store)
+    orch, _ = orch_factory()
     session = AsyncMock()
 
     result = await orch.handle_callback(
@@ -315,21 +318,22 @@ async def test_cancel_clears_state() -> None:
     )
 
     assert "cancel" in result.reply_text.lower()
-    assert not store.has(42)
+    assert not await store.has(42)
 
 
 # ── Edit flow ─────────────────────────────────────────────────────────────────
 
 
 @pytest.mark.asyncio
-async def test_edit_enters_clarifying() -> None:
+async def test_edit_enters_clarifying(
+    store: ConversationStore, orch_factory: OrchestratorFactory
+) -> None:
     """Tapping Edit should move to CLARIFYING state."""
-    store = ConversationStore()
-    store.set(
+    await store.set(
         42,
         ConversationContext(
             state=ConversationState.CONFIRMING,
-            raw_input_id=uuid.uuid4(),
+            raw_input_id=_RAW_ID,
             pending_expenses=[
                 PendingExpense(
                     amount=300,
@@ -341,7 +345,7 @@ async def test_edit_enters_clarifying() -> None:
             ],
         ),
     )
-    orch, _ = _make_orchestrator(store=store)
+    orch, _ = orch_factory()
     session = AsyncMock()
 
     result = await orch.handle_callback(
@@ -350,7 +354,7 @@ async def test_edit_enters_clarifying() -> None:
         session=session,
     )
 
-    ctx = store.get(42)
+    ctx = await store.get(42)
     assert ctx.state == ConversationState.CLARIFYING
     assert "change" in result.reply_text.lower()
 
@@ -359,45 +363,71 @@ async def test_edit_enters_clarifying() -> None:
 
 
 @pytest.mark.asyncio
-async def test_greeting_intent() -> None:
+async def test_greeting_intent(store: ConversationStore, orch_factory: OrchestratorFactory) -> None:
     """Greeting intents should reply without entering the flow."""
     response = _make_llm_response(
         content="Hello! How can I help?",
         tool_calls=[_expense_tool_call([], intent="greeting")],
     )
-    store = ConversationStore()
-    orch, _ = _make_orchestrator(response, store)
+    orch, _ = orch_factory(response)
     session = AsyncMock()
 
     result = await orch.handle_message(
         user_id=42,
-        text="hello",
+        text="hello, how are you doing today?",
         session=session,
-        raw_input_id=uuid.uuid4(),
+        raw_input_id=_RAW_ID,
     )
 
-    assert not store.has(42)
+    assert not await store.has(42)
     assert "hello" in result.reply_text.lower() or "help" in result.reply_text.lower()
 
 
 @pytest.mark.asyncio
-async def test_query_intent() -> None:
+async def test_small_talk_skips_llm(orch_factory: OrchestratorFactory) -> None:
+    """Bare greetings and thanks should be answered without calling the LLM."""
+    orch, mock_llm = orch_factory()
+
+    for text in ("Hi there!", "thanks", "Good morning"):
+        result = await orch.handle_message(
+            user_id=42,
+            text=text,
+            session=AsyncMock(),
+            raw_input_id=_RAW_ID,
+        )
+        assert result.reply_text
+
+    mock_llm.chat.assert_not_called()
+
+
+class TestSmallTalkReply:
+    def test_greeting(self) -> None:
+        assert _small_talk_reply("Hello!") is not None
+
+    def test_expense_with_greeting_is_not_small_talk(self) -> None:
+        assert _small_talk_reply("hi, groceries 300") is None
+
+    def test_long_message_is_not_small_talk(self) -> None:
+        assert _small_talk_reply("hello " * 10) is None
+
+
+@pytest.mark.asyncio
+async def test_query_intent(store: ConversationStore, orch_factory: OrchestratorFactory) -> None:
     """Query intents should clear state and attempt a query flow (Phase 5)."""
     response = _make_llm_response(
         tool_calls=[_expense_tool_call([], intent="query")],
     )
-    store = ConversationStore()
-    orch, _ = _make_orchestrator(response, store)
+    orch, _ = orch_factory(response)
     session = AsyncMock()
 
     result = await orch.handle_message(
         user_id=42,
         text="how much did we spend?",
         session=session,
-        raw_input_id=uuid.uuid4(),
+        raw_input_id=_RAW_ID,
     )
 
-    assert not store.has(42)
+    assert not await store.has(42)
     # The query handler will attempt to call a query tool. Since the mock LLM
     # returns a parse_expense tool call (not a query tool), it may fail or
     # return a fallback. Just verify it doesn't crash and returns something.
@@ -409,10 +439,11 @@ async def test_query_intent() -> None:
 
 
 @pytest.mark.asyncio
-async def test_llm_failure_returns_error() -> None:
+async def test_llm_failure_returns_error(
+    store: ConversationStore, orch_factory: OrchestratorFactory
+) -> None:
     """If the LLM call raises, the user should get an error message."""
-    store = ConversationStore()
-    orch, mock_llm = _make_orchestrator(store=store)
+    orch, mock_llm = orch_factory()
     mock_llm.chat = AsyncMock(side_effect=RuntimeError("LLM down"))
     session = AsyncMock()
 
@@ -420,18 +451,20 @@ async def test_llm_failure_returns_error() -> None:
         user_id=42,
         text="groceries 300",
         session=session,
-        raw_input_id=uuid.uuid4(),
+        raw_input_id=_RAW_ID,
     )
 
     assert "trouble" in result.reply_text.lower()
-    assert not store.has(42)
+    assert not await store.has(42)
 
 
 # ── Multiple expenses ─────────────────────────────────────────────────────────
 
 
 @pytest.mark.asyncio
-async def test_multiple_expenses_all_complete() -> None:
+async def test_multiple_expenses_all_complete(
+    store: ConversationStore, orch_factory: OrchestratorFactory
+) -> None:
     """Multiple complete expenses should all reach CONFIRMING."""
     response = _make_llm_response(
         tool_calls=[
@@ -443,32 +476,32 @@ async def test_multiple_expenses_all_complete() -> None:
             )
         ]
     )
-    store = ConversationStore()
-    orch, _ = _make_orchestrator(response, store)
+    orch, _ = orch_factory(response)
     session = AsyncMock()
 
     result = await orch.handle_message(
         user_id=42,
         text="groceries 300 and gas 200, I paid, split 50/50",
         session=session,
-        raw_input_id=uuid.uuid4(),
+        raw_input_id=_RAW_ID,
     )
 
-    ctx = store.get(42)
+    ctx = await store.get(42)
     assert ctx.state == ConversationState.CONFIRMING
     assert len(ctx.pending_expenses) == 2
     assert result.keyboard is not None
 
 
 @pytest.mark.asyncio
-async def test_multiple_expenses_commit_all() -> None:
+async def test_multiple_expenses_commit_all(
+    store: ConversationStore, orch_factory: OrchestratorFactory
+) -> None:
     """Confirming multiple expenses should write all to ledger."""
-    store = ConversationStore()
-    store.set(
+    await store.set(
         42,
         ConversationContext(
             state=ConversationState.CONFIRMING,
-            raw_input_id=uuid.uuid4(),
+            raw_input_id=_RAW_ID,
             pending_expenses=[
                 PendingExpense(
                     amount=300,
@@ -487,10 +520,9 @@ async def test_multiple_expenses_commit_all() -> None:
             ],
         ),
     )
-    orch, _ = _make_orchestrator(store=store)
+    orch, _ = orch_factory()
     session = AsyncMock()
-    session.add = MagicMock()
-    session.flush = AsyncMock()
+    session.add_all = MagicMock()
 
     result = await orch.handle_callback(
         user_id=42,
@@ -499,17 +531,57 @@ async def test_multiple_expenses_commit_all() -> None:
     )
 
     assert "2 expense" in result.reply_text.lower()
-    assert session.add.call_count == 2
+    # Both entries should be added in one batch.
+    session.add_all.assert_called_once()
+    assert list(map(attrgetter("amount"), session.add_all.call_args.args[0])) == [300, 200]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_confirms_commit_once(
+    store: ConversationStore, orch_factory: OrchestratorFactory
+) -> None:
+    """A double-tapped Confirm should be serialized and commit only once."""
+    await store.set(
+        42,
+        ConversationContext(
+            state=ConversationState.CONFIRMING,
+            raw_input_id=_RAW_ID,
+            pending_expenses=[
+                PendingExpense(
+                    amount=300,
+                    category="groceries",
+                    payer="user",
+                    split_payer_pct=50,
+                    split_other_pct=50,
+                ),
+            ],
+        ),
+    )
+    orch, _ = orch_factory()
+    session = AsyncMock()
+    session.add_all = MagicMock()
+
+    async def slow_flush() -> None:
+        await asyncio.sleep(0.01)
+
+    session.flush = AsyncMock(side_effect=slow_flush)
+
+    results = await asyncio.gather(
+        orch.handle_callback(user_id=42, callback_data=f"{CB_CONFIRM}:", session=session),
+        orch.handle_callback(user_id=42, callback_data=f"{CB_CONFIRM}:", session=session),
+    )
+
+    session.add_all.assert_called_once()
+    assert "No pending expenses" in results[1].reply_text
 
 
 # ── Callback with no pending state ───────────────────────────────────────────
 
 
 @pytest.mark.asyncio
-async def test_callback_with_no_state() -> None:
+async def test_callback_with_no_state(orch_factory: OrchestratorFactory) -> None:
     """Callback when user has no pending expenses should return error."""
-    store = ConversationStore()
-    orch, _ = _make_orchestrator(store=store)
+    orch, _ = orch_factory()
     session = AsyncMock()
 
     result = await orch.handle_callback(
@@ -543,6 +615,15 @@ class TestParsesSplit:
     def test_doesnt_sum_to_100(self) -> None:
         assert _parse_split("50/60") == (None, None)
 
+    def test_decimal_shares(self) -> None:
+        assert _parse_split("33.3/66.7") == (33.3, 66.7)
+
+    def test_bare_percentage(self) -> None:
+        assert _parse_split("70%") == (70, 30)
+
+    def test_percentage_over_100(self) -> None:
+        assert _parse_split("150") == (None, None)
+
 
 class TestResolveDate:
     def test_valid_date(self) -> None:
@@ -557,6 +638,10 @@ class TestResolveDate:
     def test_invalid_returns_today(self) -> None:
         assert _resolve_date("not-a-date") == date.today()
 
+    def test_stale_2023_year_is_moved_to_current_year(self) -> None:
+        expected = date(date.today().year, 3, 4)
+        assert _resolve_date("2023-03-04") == expected
+
 
 class TestBuildClarificationQuestion:
     def test_payer_question(self) -> None:
@@ -589,7 +674,11 @@ class TestBuildClarificationQuestion:
             1,
             [PendingExpense(amount=100), PendingExpense(amount=200)],
         )
-        assert "#2" in q
+        assert q.startswith("For expense #2: Who paid")
+
+    def test_unknown_field_falls_back(self) -> None:
+        q = _build_clarification_question("notes", 0, [PendingExpense(amount=300)])
+        assert q == "Could you provide the notes for <b>ILS 300</b>?"
 
 
 class TestMergeFieldManually:
@@ -603,6 +692,16 @@ class TestMergeFieldManually:
         _merge_field_manually(expenses, "payer", "partner")
         assert expenses[0].payer == "partner"
 
+    def test_payer_alias_is_case_insensitive(self) -> None:
+        expenses = [PendingExpense(amount=300, category="groceries")]
+        _merge_field_manually(expenses, "payer", "  My Partner ")
+        assert expenses[0].payer == "partner"
+
+    def test_payer_ambiguous_defaults_to_user(self) -> None:
+        expenses = [PendingExpense(amount=300, category="groceries")]
+        _merge_field_manually(expenses, "payer", "not sure")
+        assert expenses[0].payer == "user"
+
     def test_split(self) -> None:
         expenses = [PendingExpense(amount=300, category="groceries")]
         _merge_field_manually(expenses, "split_payer_pct", "70/30")
@@ -628,3 +727,16 @@ class TestMergeFieldManually:
         _merge_field_manually(expenses, "payer", "me")
         assert expenses[0].payer == "user"
         assert expenses[1].payer == "user"
+
+    def test_split_applies_to_all_missing(self) -> None:
+        expenses = [
+            PendingExpense(amount=300, category="groceries"),
+            PendingExpense(amount=200, category="gas", split_payer_pct=100, split_other_pct=0),
+            PendingExpense(amount=100, category="coffee"),
+        ]
+        _merge_field_manually(expenses, "split_payer_pct", "60/40")
+        assert [(e.split_payer_pct, e.split_other_pct) for e in expenses] == [
+            (60, 40),
+            (100, 0),
+            (60, 40),
+        ]
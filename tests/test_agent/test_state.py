@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import pytest
+from pydantic import ValidationError
+
+from finbot.agent import state
 from finbot.agent.state import (
     ConversationContext,
     ConversationState,
     ConversationStore,
     PendingExpense,
+    RedisConversationStore,
+    create_conversation_store,
+    get_conversation_store,
 )
 
+_RAW_ID = uuid4()
+
 # ── PendingExpense ─────────────────────────────────────────────────────────────
 
 
@@ -62,6 +73,37 @@ class TestPendingExpense:
         assert exp.split_payer_pct == 70
         assert exp.split_other_pct == 30
 
+    def test_first_missing_field_follows_required_order(self) -> None:
+        exp = PendingExpense(amount=10, payer="user")
+        assert exp.first_missing_field() == "category"
+        assert (
+            PendingExpense(
+                amount=50, category="coffee", payer="user", split_payer_pct=50, split_other_pct=50
+            ).first_missing_field()
+            is None
+        )
+
+    def test_value_equality(self) -> None:
+        assert PendingExpense(amount=300, category="groceries") == PendingExpense(
+            amount=300, category="groceries"
+        )
+        assert PendingExpense(amount=300) != PendingExpense(amount=200)
+
+    def test_from_parsed_coerces_strings(self) -> None:
+        exp = PendingExpense.from_parsed({"amount": "300", "split_payer_pct": "50"})
+        assert exp.amount == 300.0
+        assert exp.split_payer_pct == 50.0
+
+    def test_from_parsed_rejects_invalid_amount(self) -> None:
+        with pytest.raises(ValidationError):
+            PendingExpense.from_parsed({"amount": "three hundred"})
+
+    def test_from_parsed_many(self) -> None:
+        items = [{"amount": "300", "category": "groceries", "extra": 1}, {"amount": 50}]
+        assert PendingExpense.from_parsed_many(items) == [
+            PendingExpense.from_parsed(item) for item in items
+        ]
+
     def test_from_parsed_empty_dict(self) -> None:
         exp = PendingExpense.from_parsed({})
         assert exp.amount is None
@@ -163,42 +205,155 @@ class TestConversationContext:
 
 
 class TestConversationStore:
-    def test_get_creates_fresh(self) -> None:
+    @pytest.mark.asyncio
+    async def test_get_creates_fresh(self) -> None:
         store = ConversationStore()
-        ctx = store.get(111)
+        ctx = await store.get(111)
         assert ctx.state == ConversationState.IDLE
-        assert store.has(111)
+        assert await store.has(111)
 
-    def test_set_and_get(self) -> None:
+    @pytest.mark.asyncio
+    async def test_set_and_get(self) -> None:
         store = ConversationStore()
         ctx = ConversationContext(
             state=ConversationState.CONFIRMING,
-            raw_input_id=uuid4(),
+            raw_input_id=_RAW_ID,
         )
-        store.set(222, ctx)
-        retrieved = store.get(222)
+        await store.set(222, ctx)
+        retrieved = await store.get(222)
         assert retrieved.state == ConversationState.CONFIRMING
         assert retrieved.raw_input_id == ctx.raw_input_id
 
-    def test_clear(self) -> None:
+    @pytest.mark.asyncio
+    async def test_clear(self) -> None:
         store = ConversationStore()
-        store.get(333)  # creates entry
-        assert store.has(333)
-        store.clear(333)
-        assert not store.has(333)
+        await store.get(333)  # creates entry
+        assert await store.has(333)
+        await store.clear(333)
+        assert not await store.has(333)
 
-    def test_clear_nonexistent_is_safe(self) -> None:
+    @pytest.mark.asyncio
+    async def test_clear_nonexistent_is_safe(self) -> None:
         store = ConversationStore()
-        store.clear(999)  # should not raise
+        await store.clear(999)  # should not raise
 
-    def test_has_false_for_unknown(self) -> None:
+    @pytest.mark.asyncio
+    async def test_has_false_for_unknown(self) -> None:
         store = ConversationStore()
-        assert not store.has(444)
+        assert not await store.has(444)
 
-    def test_independent_users(self) -> None:
+    @pytest.mark.asyncio
+    async def test_independent_users(self) -> None:
         store = ConversationStore()
-        ctx_a = store.get(100)
-        store.get(200)  # Initialize user 200 with default context
+        ctx_a = await store.get(100)
+        await store.get(200)  # Initialize user 200 with default context
         ctx_a.state = ConversationState.CLARIFYING
-        store.set(100, ctx_a)
-        assert store.get(200).state == ConversationState.IDLE
+        await store.set(100, ctx_a)
+        assert (await store.get(200)).state == ConversationState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_contains(self) -> None:
+        store = ConversationStore()
+        await store.get(555)
+        assert 555 in store
+        assert 666 not in store
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self) -> None:
+        store = ConversationStore(maxsize=2)
+        await store.get(1)
+        await store.get(2)
+        await store.get(1)  # touch 1 so 2 becomes the oldest
+        await store.get(3)
+        assert await store.has(1)
+        assert not await store.has(2)
+        assert await store.has(3)
+
+    def test_lock_is_per_user(self) -> None:
+        store = ConversationStore()
+        assert store.lock(1) is store.lock(1)
+        assert store.lock(1) is not store.lock(2)
+
+    @pytest.mark.asyncio
+    async def test_expires_idle_contexts(self) -> None:
+        store = ConversationStore(ttl=60)
+        with patch("finbot.agent.state.time.monotonic", return_value=1000.0):
+            (await store.get(777)).state = ConversationState.CLARIFYING
+        with patch("finbot.agent.state.time.monotonic", return_value=1059.0):
+            assert (await store.get(777)).state == ConversationState.CLARIFYING
+        with patch("finbot.agent.state.time.monotonic", return_value=1200.0):
+            assert not await store.has(777)
+            assert (await store.get(777)).state == ConversationState.IDLE
+
+
+# ── RedisConversationStore ─────────────────────────────────────────────────────
+
+
+class TestRedisConversationStore:
+    def _store(self) -> tuple[RedisConversationStore, AsyncMock]:
+        data: dict[str, str] = {}
+        client = AsyncMock()
+        client.getex.side_effect = lambda key, ex: data.get(key)
+        client.setex.side_effect = lambda key, ttl, value: data.__setitem__(key, value)
+        client.exists.side_effect = lambda key: int(key in data)
+        client.delete.side_effect = lambda key: data.pop(key, None)
+        return RedisConversationStore(client, ttl=60), client
+
+    @pytest.mark.asyncio
+    async def test_round_trips_context(self) -> None:
+        store, client = self._store()
+        ctx = ConversationContext(
+            state=ConversationState.CONFIRMING,
+            raw_input_id=_RAW_ID,
+            pending_expenses=[PendingExpense(amount=300, category="groceries")],
+        )
+        await store.set(42, ctx)
+        client.setex.assert_awaited_once()
+        assert client.setex.call_args.args[:2] == ("finbot:ctx:42", 60)
+        assert await store.get(42) == ctx
+
+    @pytest.mark.asyncio
+    async def test_get_creates_fresh(self) -> None:
+        store, _ = self._store()
+        assert (await store.get(7)).state == ConversationState.IDLE
+        assert await store.has(7)
+
+    def test_lock_uses_a_shared_redis_lock(self) -> None:
+        store, client = self._store()
+        client.lock = MagicMock()
+        assert store.lock(9) is client.lock.return_value
+        client.lock.assert_called_once_with("finbot:ctx:lock:9", timeout=120.0)
+
+    @pytest.mark.asyncio
+    async def test_clear(self) -> None:
+        store, _ = self._store()
+        await store.get(8)
+        await store.clear(8)
+        assert not await store.has(8)
+
+
+# ── Store selection ───────────────────────────────────────────────────────────
+
+
+class TestCreateConversationStore:
+    def test_memory_backend(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(state.settings, "state_backend", "memory")
+        assert isinstance(create_conversation_store(), ConversationStore)
+
+    def test_unknown_backend_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(state.settings, "state_backend", "memroy")
+        with pytest.raises(ValueError, match="Unknown state backend"):
+            create_conversation_store()
+
+    def test_redis_backend_without_extra_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(state.settings, "state_backend", "redis")
+        # A None entry makes the import fail as if the package were absent.
+        monkeypatch.setitem(sys.modules, "redis", None)
+        monkeypatch.setitem(sys.modules, "redis.asyncio", None)
+        with pytest.raises(RuntimeError, match="redis extra"):
+            create_conversation_store()
+
+    def test_store_is_built_on_first_use(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(state, "_conversation_store", None)
+        store = get_conversation_store()
+        assert get_conversation_store() is store
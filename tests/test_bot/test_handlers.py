@@ -9,7 +9,8 @@ from __future__ import annotations
 
 from datetime import date
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -19,6 +20,7 @@ from finbot.agent.orchestrator import (
     _looks_like_settlement,
     _postprocess_parsed_expenses,
 )
+from finbot.bot import handlers
 from finbot.bot.formatters import format_query_result
 from finbot.bot.handlers import (
     cmd_balance,
@@ -30,48 +32,45 @@ from finbot.bot.handlers import (
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# Replies returned by ``answer()``. Handlers only read ``message_id``, so one
+# shared instance per mock kind is enough.
+_PROTO_SENT = SimpleNamespace(message_id=999)
+_PROTO_SENT_CB = SimpleNamespace(message_id=1000)
+
+# Stand-in for the RawInput row returned by ``save_raw_input``; handlers only
+# read its ``id``.
+_FAKE_RAW = SimpleNamespace(id=uuid4())
+
 
 def _make_message(text: str = "", user_id: int = 111) -> MagicMock:
-    """Create a minimal mock of an aiogram ``Message``."""
-    msg = AsyncMock()
-    msg.text = text
-    msg.from_user = MagicMock()
+    """Create a minimal mock of an aiogram ``Message``.
+
+    Only the awaited methods are ``AsyncMock``s: an ``AsyncMock`` root would
+    turn every attribute into a (much slower to build) ``AsyncMock`` too.
+    """
+    msg = MagicMock(text=text, answer=AsyncMock(return_value=_PROTO_SENT))
     msg.from_user.id = user_id
-    msg.answer = AsyncMock()
-    # answer() returns a sent message with a message_id.
-    sent = MagicMock()
-    sent.message_id = 999
-    msg.answer.return_value = sent
     return msg
 
 
-def _make_callback_query(
-    data: str = "confirm:",
-    user_id: int = 111,
-) -> MagicMock:
+def _make_callback_query(data: str = "confirm:", user_id: int = 111) -> MagicMock:
     """Create a minimal mock of an aiogram ``CallbackQuery``."""
-    cq = AsyncMock()
-    cq.data = data
-    cq.from_user = MagicMock()
+    message = MagicMock(
+        answer=AsyncMock(return_value=_PROTO_SENT_CB),
+        edit_text=AsyncMock(),
+        edit_reply_markup=AsyncMock(),
+    )
+    cq = MagicMock(data=data, answer=AsyncMock(), message=message)
     cq.from_user.id = user_id
-    cq.answer = AsyncMock()
-    cq.message = AsyncMock()
-    cq.message.answer = AsyncMock()
-    cq.message.edit_text = AsyncMock()
-    cq.message.edit_reply_markup = AsyncMock()
-    # message.answer() returns a sent message.
-    sent = MagicMock()
-    sent.message_id = 1000
-    cq.message.answer.return_value = sent
     return cq
 
 
 def _make_orchestrator_result(
     reply_text: str = "OK",
-    keyboard: MagicMock | None = None,
+    keyboard: object | None = None,
     edit_message_id: int | None = None,
 ) -> OrchestratorResult:
-    """Build an OrchestratorResult for testing."""
+    """Create an OrchestratorResult with no LLM responses."""
     return OrchestratorResult(
         reply_text=reply_text,
         keyboard=keyboard,
@@ -80,6 +79,14 @@ def _make_orchestrator_result(
     )
 
 
+# Read-only partnership row shared by the /balance tests.
+_PARTNERSHIP = SimpleNamespace(
+    user_a_telegram_id=42,
+    user_b_telegram_id=99,
+    default_currency="ILS",
+)
+
+
 # ── Command tests ─────────────────────────────────────────────────────────────
 
 
@@ -104,17 +111,13 @@ async def test_cmd_help_sends_help() -> None:
 
 
 @pytest.mark.asyncio
-async def test_cmd_balance_no_partnership() -> None:
+async def test_cmd_balance_no_partnership(monkeypatch: pytest.MonkeyPatch) -> None:
     """Balance command without a partnership should inform the user."""
     msg = _make_message()
     session = AsyncMock()
 
-    with patch(
-        "finbot.ledger.repository.get_partnership",
-        new_callable=AsyncMock,
-        return_value=None,
-    ):
-        await cmd_balance(msg, session)
+    monkeypatch.setattr("finbot.ledger.repository.get_partnership", AsyncMock(return_value=None))
+    await cmd_balance(msg, session)
 
     msg.answer.assert_called_once()
     text = msg.answer.call_args[0][0]
@@ -122,33 +125,17 @@ async def test_cmd_balance_no_partnership() -> None:
 
 
 @pytest.mark.asyncio
-async def test_cmd_balance_with_partnership() -> None:
+async def test_cmd_balance_with_partnership(monkeypatch: pytest.MonkeyPatch) -> None:
     """Balance command with a partnership should show the balance."""
     msg = _make_message()
     session = AsyncMock()
 
-    mock_partnership = MagicMock()
-    mock_partnership.user_a_telegram_id = 42
-    mock_partnership.user_b_telegram_id = 99
-    mock_partnership.default_currency = "ILS"
-
-    with (
-        patch(
-            "finbot.ledger.repository.get_partnership",
-            new_callable=AsyncMock,
-            return_value=mock_partnership,
-        ),
-        patch(
-            "finbot.ledger.repository.get_partner_id",
-            return_value=99,
-        ),
-        patch(
-            "finbot.ledger.balance.get_balance",
-            new_callable=AsyncMock,
-            return_value=Decimal("150"),
-        ),
-    ):
-        await cmd_balance(msg, session)
+    monkeypatch.setattr(
+        "finbot.ledger.repository.get_partnership", AsyncMock(return_value=_PARTNERSHIP)
+    )
+    monkeypatch.setattr("finbot.ledger.repository.get_partner_id", MagicMock(return_value=99))
+    monkeypatch.setattr("finbot.ledger.balance.get_balance", AsyncMock(return_value=Decimal("150")))
+    await cmd_balance(msg, session)
 
     msg.answer.assert_called_once()
     text = msg.answer.call_args[0][0]
@@ -158,121 +145,62 @@ async def test_cmd_balance_with_partnership() -> None:
 # ── General text handler tests ────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
-async def test_handle_text_saves_raw_input_and_processes() -> None:
-    """The text handler should persist the message and send it through the orchestrator."""
-    msg = _make_message(text="groceries 300", user_id=42)
-
-    fake_raw = MagicMock()
-    fake_raw.id = uuid4()
-
-    session = AsyncMock()
-    session.add = MagicMock()
-    session.flush = AsyncMock()
-
-    orch_result = _make_orchestrator_result(reply_text="Parsed 1 expense(s).")
-
-    with (
-        patch(
-            "finbot.bot.handlers.save_raw_input",
-            new_callable=AsyncMock,
-            return_value=fake_raw,
-        ) as mock_save,
-        patch(
-            "finbot.bot.handlers.process_message",
-            new_callable=AsyncMock,
-            return_value=orch_result,
-        ) as mock_process,
-    ):
-        await handle_text(msg, session=session)
-
-        mock_save.assert_called_once_with(
-            session=session,
-            telegram_user_id=42,
-            raw_text="groceries 300",
-        )
-        mock_process.assert_called_once_with(
-            user_id=42,
-            text="groceries 300",
-            session=session,
-            raw_input_id=fake_raw.id,
-        )
+_KEYBOARD = object()
 
-    msg.answer.assert_called_once()
-    text = msg.answer.call_args[0][0]
-    assert "Parsed" in text
 
-
-@pytest.mark.asyncio
-async def test_handle_text_with_keyboard() -> None:
-    """When the orchestrator returns a keyboard, it should be attached to the reply."""
-    msg = _make_message(text="groceries 300 I paid 50/50", user_id=42)
-
-    fake_raw = MagicMock()
-    fake_raw.id = uuid4()
-
-    session = AsyncMock()
-    session.add = MagicMock()
-    session.flush = AsyncMock()
-
-    fake_keyboard = MagicMock()
-    orch_result = _make_orchestrator_result(
-        reply_text="Confirm?",
-        keyboard=fake_keyboard,
-    )
-
-    with (
-        patch(
-            "finbot.bot.handlers.save_raw_input",
-            new_callable=AsyncMock,
-            return_value=fake_raw,
+@pytest.mark.parametrize(
+    ("text", "reply_text", "keyboard", "expected_substring"),
+    [
+        # The message is persisted, sent through the orchestrator and answered.
+        pytest.param("groceries 300", "Parsed 1 expense(s).", None, "Parsed", id="processes"),
+        # An orchestrator keyboard is attached to the reply.
+        pytest.param(
+            "groceries 300 I paid 50/50", "Confirm?", _KEYBOARD, "Confirm", id="with_keyboard"
         ),
-        patch(
-            "finbot.bot.handlers.process_message",
-            new_callable=AsyncMock,
-            return_value=orch_result,
+        # An orchestrator error reply is still sent to the user.
+        pytest.param(
+            "groceries 300",
+            "I'm having trouble processing your message.",
+            None,
+            "trouble",
+            id="llm_failure",
         ),
-    ):
-        await handle_text(msg, session=session)
-
-    msg.answer.assert_called_once()
-    call_kwargs = msg.answer.call_args
-    assert call_kwargs.kwargs.get("reply_markup") is fake_keyboard
-
-
+    ],
+)
 @pytest.mark.asyncio
-async def test_handle_text_handles_llm_failure() -> None:
-    """When the orchestrator returns an error, the handler should still reply."""
-    msg = _make_message(text="groceries 300", user_id=42)
-
-    fake_raw = MagicMock()
-    fake_raw.id = uuid4()
-
-    session = AsyncMock()
-    session.add = MagicMock()
-    session.flush = AsyncMock()
+async def test_handle_text_flow(
+    monkeypatch: pytest.MonkeyPatch,
+    text: str,
+    reply_text: str,
+    keyboard: object | None,
+    expected_substring: str,
+) -> None:
+    """The text handler should persist the message, run the orchestrator and reply."""
+    msg = _make_message(text=text, user_id=42)
+    session = MagicMock()
+
+    orch_result = _make_orchestrator_result(reply_text=reply_text, keyboard=keyboard)
+    mock_save = AsyncMock(return_value=_FAKE_RAW)
+    mock_process = AsyncMock(return_value=orch_result)
+    monkeypatch.setattr(handlers, "save_raw_input", mock_save)
+    monkeypatch.setattr(handlers, "process_message", mock_process)
+    await handle_text(msg, session=session)
 
-    orch_result = _make_orchestrator_result(
-        reply_text="I'm having trouble processing your message.",
+    mock_save.assert_called_once_with(
+        session=session,
+        telegram_user_id=42,
+        raw_text=text,
+    )
+    mock_process.assert_called_once_with(
+        user_id=42,
+        text=text,
+        session=session,
+        raw_input_id=_FAKE_RAW.id,
     )
-
-    with (
-        patch(
-            "finbot.bot.handlers.save_raw_input",
-            new_callable=AsyncMock,
-            return_value=fake_raw,
-        ),
-        patch(
-            "finbot.bot.handlers.process_message",
-            new_callable=AsyncMock,
-            return_value=orch_result,
-        ),
-    ):
-        await handle_text(msg, session=session)
 
     msg.answer.assert_called_once()
-    text = msg.answer.call_args[0][0]
-    assert "trouble" in text.lower()
+    assert expected_substring in msg.answer.call_args[0][0]
+    assert msg.answer.call_args.kwargs.get("reply_markup") is keyboard
 
 
 @pytest.mark.asyncio
@@ -305,7 +233,9 @@ async def test_handle_text_ignores_empty_text() -> None:
 
 
 @pytest.mark.asyncio
-async def test_handle_callback_confirm() -> None:
+async def test_handle_callback_confirm(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Confirm callback should call process_callback and send the reply."""
     cq = _make_callback_query(data="confirm:abc", user_id=42)
     session = AsyncMock()
@@ -314,18 +244,15 @@ async def test_handle_callback_confirm() -> None:
         reply_text="Committed 1 expense.",
     )
 
-    with patch(
-        "finbot.bot.handlers.process_callback",
-        new_callable=AsyncMock,
-        return_value=orch_result,
-    ) as mock_cb:
-        await handle_callback(cq, session=session)
+    mock_cb = AsyncMock(return_value=orch_result)
+    monkeypatch.setattr(handlers, "process_callback", mock_cb)
+    await handle_callback(cq, session=session)
 
-        mock_cb.assert_called_once_with(
-            user_id=42,
-            callback_data="confirm:abc",
-            session=session,
-        )
+    mock_cb.assert_called_once_with(
+        user_id=42,
+        callback_data="confirm:abc",
+        session=session,
+    )
 
     cq.answer.assert_called_once()
     cq.message.answer.assert_called_once()
@@ -333,7 +260,9 @@ async def test_handle_callback_confirm() -> None:
 
 
 @pytest.mark.asyncio
-async def test_handle_callback_cancel() -> None:
+async def test_handle_callback_cancel(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """Cancel callback should send cancellation message."""
     cq = _make_callback_query(data="cancel:", user_id=42)
     session = AsyncMock()
@@ -342,12 +271,8 @@ async def test_handle_callback_cancel() -> None:
         reply_text="Cancelled. No expenses were recorded.",
     )
 
-    with patch(
-        "finbot.bot.handlers.process_callback",
-        new_callable=AsyncMock,
-        return_value=orch_result,
-    ):
-        await handle_callback(cq, session=session)
+    monkeypatch.setattr(handlers, "process_callback", AsyncMock(return_value=orch_result))
+    await handle_callback(cq, session=session)
 
     cq.answer.assert_called_once()
     cq.message.answer.assert_called_once()
@@ -355,7 +280,9 @@ async def test_handle_callback_cancel() -> None:
 
 
 @pytest.mark.asyncio
-async def test_handle_callback_edit_message_id() -> None:
+async def test_handle_callback_edit_message_id(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     """When edit_message_id is set, should try to edit the original message."""
     cq = _make_callback_query(data="confirm:", user_id=42)
     session = AsyncMock()
@@ -365,12 +292,8 @@ async def test_handle_callback_edit_message_id() -> None:
         edit_message_id=555,
     )
 
-    with patch(
-        "finbot.bot.handlers.process_callback",
-        new_callable=AsyncMock,
-        return_value=orch_result,
-    ):
-        await handle_callback(cq, session=session)
+    monkeypatch.setattr(handlers, "process_callback", AsyncMock(return_value=orch_result))
+    await handle_callback(cq, session=session)
 
     cq.answer.assert_called_once()
     cq.message.edit_text.assert_called_once()
@@ -406,24 +329,42 @@ async def test_handle_callback_ignores_empty_user() -> None:
     cq.answer.assert_called_once()
 
 
+# ── Relative-date postprocessing tests ───────────────────────────────────────
+
+_FROZEN_TODAY = date(2026, 2, 7)
+
+
+class _FrozenDate(date):
+    """``date`` whose ``today()`` is pinned to :data:`_FROZEN_TODAY`."""
+
+    @classmethod
+    def today(cls) -> date:
+        return _FROZEN_TODAY
+
+
+@pytest.fixture
+def frozen_today(monkeypatch: pytest.MonkeyPatch) -> date:
+    """Pin the orchestrator's ``date.today()`` to :data:`_FROZEN_TODAY`."""
+    monkeypatch.setattr("finbot.agent.orchestrator.date", _FrozenDate)
+    return _FROZEN_TODAY
+
+
+@pytest.mark.usefixtures("frozen_today")
 def test_postprocess_relative_date_yesterday() -> None:
     parsed = {
         "expenses": [{"amount": 240, "event_date": "2023-10-07"}],
     }
-    with patch("finbot.agent.orchestrator.date") as mock_date:
-        mock_date.today.return_value = date(2026, 2, 7)
-        result = _postprocess_parsed_expenses("gas 240 yesterday", parsed)
+    result = _postprocess_parsed_expenses("gas 240 yesterday", parsed)
 
     assert result["expenses"][0]["event_date"] == "2026-02-06"
 
 
+@pytest.mark.usefixtures("frozen_today")
 def test_postprocess_relative_date_one_week() -> None:
     parsed = {
         "expenses": [{"amount": 300, "event_date": "2023-10-21"}],
     }
-    with patch("finbot.agent.orchestrator.date") as mock_date:
-        mock_date.today.return_value = date(2026, 2, 7)
-        result = _postprocess_parsed_expenses("water bill one week ago 300", parsed)
+    result = _postprocess_parsed_expenses("water bill one week ago 300", parsed)
 
     assert result["expenses"][0]["event_date"] == "2026-01-31"
 
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -14,8 +15,6 @@ from finbot.ledger.balance import (
     get_balance,
 )
 
-# ── Helpers ───────────────────────────────────────────────────────────────────
-
 USER_A = 100
 USER_B = 200
 
@@ -27,72 +26,96 @@ def _make_entry(
     payer_telegram_id: int = USER_A,
     split_payer_pct: Decimal = Decimal("50"),
     split_other_pct: Decimal = Decimal("50"),
-) -> MagicMock:
-    """Create a mock LedgerEntry with sensible defaults for testing."""
-    entry = MagicMock()
-    entry.event_type = event_type
-    entry.amount = amount
-    entry.payer_telegram_id = payer_telegram_id
-    entry.split_payer_pct = split_payer_pct
-    entry.split_other_pct = split_other_pct
-    return entry
+) -> SimpleNamespace:
+    """Create a LedgerEntry stand-in with sensible defaults.
 
+    Balance code only reads entry attributes, so a plain ``SimpleNamespace``
+    is enough.
+    """
+    return SimpleNamespace(
+        event_type=event_type,
+        amount=amount,
+        payer_telegram_id=payer_telegram_id,
+        split_payer_pct=split_payer_pct,
+        split_other_pct=split_other_pct,
+    )
 
-# ── _expense_effect tests ─────────────────────────────────────────────────────
 
+def _untouched_session() -> MagicMock:
+    """Session stub for ``get_balance`` calls with pre-fetched entries.
 
-class TestExpenseEffect:
-    """Tests for the _expense_effect helper."""
+    ``spec_set=[]`` makes any attribute access fail, so the stub also checks
+    that no query is issued.
+    """
+    return MagicMock(spec_set=[])
 
-    def test_user_a_pays_50_50(self) -> None:
-        """User A pays 300, split 50/50 → B owes A 150."""
-        entry = _make_entry(
-            payer_telegram_id=USER_A,
-            amount=Decimal("300"),
-            split_payer_pct=Decimal("50"),
-            split_other_pct=Decimal("50"),
-        )
-        result = _expense_effect(entry, USER_A, USER_B)
-        assert result == Decimal("150")
 
-    def test_user_b_pays_50_50(self) -> None:
-        """User B pays 300, split 50/50 → A owes B 150 (negative)."""
-        entry = _make_entry(
-            payer_telegram_id=USER_B,
-            amount=Decimal("300"),
-            split_payer_pct=Decimal("50"),
-            split_other_pct=Decimal("50"),
-        )
-        result = _expense_effect(entry, USER_A, USER_B)
-        assert result == Decimal("-150")
+# ── _expense_effect tests ─────────────────────────────────────────────────────
 
-    def test_user_a_pays_70_30(self) -> None:
-        """User A pays 300, split 70/30 → B owes A 90."""
-        entry = _make_entry(
-            payer_telegram_id=USER_A,
-            amount=Decimal("300"),
-            split_payer_pct=Decimal("70"),
-            split_other_pct=Decimal("30"),
-        )
-        result = _expense_effect(entry, USER_A, USER_B)
-        assert result == Decimal("90")
 
-    def test_user_a_pays_100_0(self) -> None:
-        """User A pays 200, split 100/0 → B owes nothing."""
+class TestExpenseEffect:
+    """Tests for the _expense_effect helper."""
+
+    @pytest.mark.parametrize(
+        ("payer", "amount", "payer_pct", "other_pct", "expected"),
+        [
+            # User A pays 300, split 50/50 → B owes A 150.
+            pytest.param(
+                USER_A,
+                Decimal("300"),
+                Decimal("50"),
+                Decimal("50"),
+                Decimal("150"),
+                id="a_pays_50_50",
+            ),
+            # User B pays 300, split 50/50 → A owes B 150 (negative).
+            pytest.param(
+                USER_B,
+                Decimal("300"),
+                Decimal("50"),
+                Decimal("50"),
+                Decimal("-150"),
+                id="b_pays_50_50",
+            ),
+            # User A pays 300, split 70/30 → B owes A 90.
+            pytest.param(
+                USER_A,
+                Decimal("300"),
+                Decimal("70"),
+                Decimal("30"),
+                Decimal("90"),
+                id="a_pays_70_30",
+            ),
+            # User A pays 200, split 100/0 → B owes nothing.
+            pytest.param(
+                USER_A,
+                Decimal("200"),
+                Decimal("100"),
+                Decimal("0"),
+                Decimal("0"),
+                id="a_pays_100_0",
+            ),
+            # An entry with an unknown payer has no effect.
+            pytest.param(
+                999, Decimal("300"), Decimal("50"), Decimal("50"), Decimal("0"), id="unknown_payer"
+            ),
+        ],
+    )
+    def test_expense_effect(
+        self,
+        payer: int,
+        amount: Decimal,
+        payer_pct: Decimal,
+        other_pct: Decimal,
+        expected: Decimal,
+    ) -> None:
         entry = _make_entry(
-            payer_telegram_id=USER_A,
-            amount=Decimal("200"),
-            split_payer_pct=Decimal("100"),
-            split_other_pct=Decimal("0"),
+            payer_telegram_id=payer,
+            amount=amount,
+            split_payer_pct=payer_pct,
+            split_other_pct=other_pct,
         )
-        result = _expense_effect(entry, USER_A, USER_B)
-        assert result == Decimal("0")
-
-    def test_unknown_payer_no_effect(self) -> None:
-        """An entry with an unknown payer has no effect."""
-        entry = _make_entry(payer_telegram_id=999)
-        result = _expense_effect(entry, USER_A, USER_B)
-        assert result == Decimal("0")
+        assert _expense_effect(entry, USER_A, USER_B) == expected
 
 
 # ── _settlement_effect tests ──────────────────────────────────────────────────
@@ -101,31 +124,24 @@ class TestExpenseEffect:
 class TestSettlementEffect:
     """Tests for the _settlement_effect helper."""
 
-    def test_user_a_pays_settlement(self) -> None:
-        """User A settles 500 → balance moves positive (B owes A more)."""
+    @pytest.mark.parametrize(
+        ("payer", "expected"),
+        [
+            # User A settles 500 → balance moves positive (B owes A more).
+            pytest.param(USER_A, Decimal("500"), id="a_pays"),
+            # User B settles 500 → balance moves negative (A owes B more).
+            pytest.param(USER_B, Decimal("-500"), id="b_pays"),
+            # Settlement with unknown payer has no effect.
+            pytest.param(999, Decimal("0"), id="unknown_payer"),
+        ],
+    )
+    def test_settlement_effect(self, payer: int, expected: Decimal) -> None:
         entry = _make_entry(
             event_type="settlement",
-            payer_telegram_id=USER_A,
+            payer_telegram_id=payer,
             amount=Decimal("500"),
         )
-        result = _settlement_effect(entry, USER_A, USER_B)
-        assert result == Decimal("500")
-
-    def test_user_b_pays_settlement(self) -> None:
-        """User B settles 500 → balance moves negative (A owes B more)."""
-        entry = _make_entry(
-            event_type="settlement",
-            payer_telegram_id=USER_B,
-            amount=Decimal("500"),
-        )
-        result = _settlement_effect(entry, USER_A, USER_B)
-        assert result == Decimal("-500")
-
-    def test_unknown_payer_no_effect(self) -> None:
-        """Settlement with unknown payer has no effect."""
-        entry = _make_entry(event_type="settlement", payer_telegram_id=999)
-        result = _settlement_effect(entry, USER_A, USER_B)
-        assert result == Decimal("0")
+        assert _settlement_effect(entry, USER_A, USER_B) == expected
 
 
 # ── _entry_effect tests ───────────────────────────────────────────────────────
@@ -134,26 +150,20 @@ class TestSettlementEffect:
 class TestEntryEffect:
     """Tests for the _entry_effect dispatcher."""
 
-    def test_expense_dispatches(self) -> None:
-        entry = _make_entry(event_type="expense")
-        result = _entry_effect(entry, USER_A, USER_B)
-        # Should return the expense effect (150 for default 300 @ 50/50).
-        assert result == Decimal("150")
-
-    def test_correction_dispatches_like_expense(self) -> None:
-        entry = _make_entry(event_type="correction")
-        result = _entry_effect(entry, USER_A, USER_B)
-        assert result == Decimal("150")
-
-    def test_settlement_dispatches(self) -> None:
-        entry = _make_entry(event_type="settlement", payer_telegram_id=USER_A)
-        result = _entry_effect(entry, USER_A, USER_B)
-        assert result == Decimal("300")  # Full amount as settlement.
-
-    def test_unknown_event_type_ignored(self) -> None:
-        entry = _make_entry(event_type="unknown_type")
-        result = _entry_effect(entry, USER_A, USER_B)
-        assert result == Decimal("0")
+    @pytest.mark.parametrize(
+        ("event_type", "expected"),
+        [
+            # Expense effect: 150 for the default 300 @ 50/50.
+            ("expense", Decimal("150")),
+            ("correction", Decimal("150")),
+            # Full amount as settlement.
+            ("settlement", Decimal("300")),
+            ("unknown_type", Decimal("0")),
+        ],
+    )
+    def test_dispatch(self, event_type: str, expected: Decimal) -> None:
+        entry = _make_entry(event_type=event_type, payer_telegram_id=USER_A)
+        assert _entry_effect(entry, USER_A, USER_B) == expected
 
 
 # ── get_balance integration tests ─────────────────────────────────────────────
@@ -165,7 +175,7 @@ class TestGetBalance:
     @pytest.mark.asyncio
     async def test_no_entries_returns_zero(self) -> None:
         """Empty ledger → zero balance."""
-        session = AsyncMock()
+        session = _untouched_session()
         result = await get_balance(session, USER_A, USER_B, entries=[])
         assert result == Decimal("0")
 
@@ -178,7 +188,7 @@ class TestGetBalance:
             split_payer_pct=Decimal("50"),
             split_other_pct=Decimal("50"),
         )
-        session = AsyncMock()
+        session = _untouched_session()
         result = await get_balance(session, USER_A, USER_B, entries=[entry])
         assert result == Decimal("150")
 
@@ -197,7 +207,7 @@ class TestGetBalance:
             split_payer_pct=Decimal("50"),
             split_other_pct=Decimal("50"),
         )
-        session = AsyncMock()
+        session = _untouched_session()
         result = await get_balance(session, USER_A, USER_B, entries=[e1, e2])
         assert result == Decimal("50")  # B still owes A 50.
 
@@ -215,7 +225,7 @@ class TestGetBalance:
             payer_telegram_id=USER_B,
             amount=Decimal("100"),
         )
-        session = AsyncMock()
+        session = _untouched_session()
         result = await get_balance(
             session,
             USER_A,
@@ -238,7 +248,7 @@ class TestGetBalance:
             payer_telegram_id=USER_B,
             amount=Decimal("150"),
         )
-        session = AsyncMock()
+        session = _untouched_session()
         result = await get_balance(
             session,
             USER_A,
@@ -272,6 +282,6 @@ class TestGetBalance:
                 amount=Decimal("30"),
             ),
         ]
-        session = AsyncMock()
+        session = _untouched_session()
         result = await get_balance(session, USER_A, USER_B, entries=entries)
         assert result == Decimal("30")
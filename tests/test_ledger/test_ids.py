@@ -0,0 +1,33 @@
+"""Tests for time-ordered primary-key generation."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from finbot.ledger.ids import uuid7
+
+
+def test_uuid7_version_and_variant() -> None:
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_embeds_millisecond_timestamp() -> None:
+    with patch("finbot.ledger.ids.time.time_ns", return_value=1_700_000_000_123_456_789):
+        value = uuid7()
+    assert value.int >> 80 == 1_700_000_000_123
+
+
+def test_uuid7_orders_by_creation_time() -> None:
+    with patch("finbot.ledger.ids.time.time_ns", return_value=1_000_000_000):
+        earlier = uuid7()
+    with patch("finbot.ledger.ids.time.time_ns", return_value=2_000_000_000):
+        later = uuid7()
+    assert earlier < later
+
+
+def test_uuid7_unique_within_same_millisecond() -> None:
+    with patch("finbot.ledger.ids.time.time_ns", return_value=1_000_000_000):
+        values = {uuid7() for _ in range(100)}
+    assert len(values) == 100
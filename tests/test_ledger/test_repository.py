@@ -9,15 +9,27 @@ from uuid import uuid4
 
 import pytest
 
-from finbot.ledger.repository import save_ledger_entry, save_raw_input
+from finbot.ledger.models import LedgerEntry
+from finbot.ledger.repository import save_ledger_entries, save_ledger_entry, save_raw_input
+
+_RAW_ID = uuid4()
+
+
+def _fast_session() -> MagicMock:
+    """Session stub exposing only what the write helpers touch.
+
+    A plain ``MagicMock`` with just ``flush`` awaited is much cheaper to build
+    than an ``AsyncMock`` root.
+    """
+    session = MagicMock(spec_set=["add", "add_all", "flush"])
+    session.flush = AsyncMock(return_value=None)
+    return session
 
 
 @pytest.mark.asyncio
 async def test_save_raw_input_creates_row() -> None:
     """save_raw_input should add a RawInput to the session and flush."""
-    session = AsyncMock()
-    session.add = MagicMock()
-    session.flush = AsyncMock()
+    session = _fast_session()
 
     result = await save_raw_input(
         session=session,
@@ -41,9 +53,7 @@ async def test_save_raw_input_creates_row() -> None:
 @pytest.mark.asyncio
 async def test_save_raw_input_preserves_exact_text() -> None:
     """Raw text should be stored exactly as received, no trimming."""
-    session = AsyncMock()
-    session.add = MagicMock()
-    session.flush = AsyncMock()
+    session = _fast_session()
 
     text_with_whitespace = "  groceries 300  \n  split 50/50  "
 
@@ -62,14 +72,11 @@ async def test_save_raw_input_preserves_exact_text() -> None:
 @pytest.mark.asyncio
 async def test_save_ledger_entry_creates_row() -> None:
     """save_ledger_entry should add a LedgerEntry and flush."""
-    session = AsyncMock()
-    session.add = MagicMock()
-    session.flush = AsyncMock()
+    session = _fast_session()
 
-    raw_id = uuid4()
     result = await save_ledger_entry(
         session,
-        raw_input_id=raw_id,
+        raw_input_id=_RAW_ID,
         event_type="expense",
         amount=Decimal("300.00"),
         currency="ILS",
@@ -83,7 +90,7 @@ async def test_save_ledger_entry_creates_row() -> None:
 
     session.add.assert_called_once()
     added = session.add.call_args[0][0]
-    assert added.raw_input_id == raw_id
+    assert added.raw_input_id == _RAW_ID
     assert added.event_type == "expense"
     assert added.amount == Decimal("300.00")
     assert added.currency == "ILS"
@@ -101,13 +108,11 @@ async def test_save_ledger_entry_creates_row() -> None:
 @pytest.mark.asyncio
 async def test_save_ledger_entry_defaults() -> None:
     """Default currency should be ILS and optional fields should be None."""
-    session = AsyncMock()
-    session.add = MagicMock()
-    session.flush = AsyncMock()
+    session = _fast_session()
 
     result = await save_ledger_entry(
         session,
-        raw_input_id=uuid4(),
+        raw_input_id=_RAW_ID,
         event_type="settlement",
         amount=Decimal("500.00"),
         payer_telegram_id=99,
@@ -120,3 +125,29 @@ async def test_save_ledger_entry_defaults() -> None:
     assert result.description is None
     assert result.tags is None
     assert result.category is None
+
+
+@pytest.mark.asyncio
+async def test_save_ledger_entries_single_flush() -> None:
+    """save_ledger_entries should add all entries at once and flush once."""
+    session = _fast_session()
+    entries = [
+        LedgerEntry(raw_input_id=_RAW_ID, event_type="expense", amount=Decimal(amount))
+        for amount in ("300.00", "200.00")
+    ]
+
+    result = await save_ledger_entries(session, entries)
+
+    session.add_all.assert_called_once_with(entries)
+    session.flush.assert_called_once()
+    assert result is entries
+
+
+@pytest.mark.asyncio
+async def test_save_ledger_entries_empty_is_noop() -> None:
+    """An empty batch should not touch the session."""
+    session = _fast_session()
+
+    assert await save_ledger_entries(session, []) == []
+    session.add_all.assert_not_called()
+    session.flush.assert_not_called()
@@ -10,6 +10,20 @@ USER_A = 100
 USER_B = 200
 
 
+def _split(errors: list[str]) -> tuple[list[str], list[str]]:
+    """Split *errors* into ``(hard_errors, warnings)`` in one pass."""
+    hard: list[str] = []
+    warnings: list[str] = []
+    for e in errors:
+        (warnings if e.startswith("WARNING:") else hard).append(e)
+    return hard, warnings
+
+
+def _contains_ci(errors: list[str], needle: str) -> bool:
+    """Whether any entry of *errors* contains lowercase *needle*, ignoring case."""
+    return needle in "\n".join(errors).lower()
+
+
 class TestValidateSettlement:
     """Tests for the validate_settlement function."""
 
@@ -33,9 +47,8 @@ class TestValidateSettlement:
             current_balance=Decimal("200"),  # B owes A 200
         )
         # No hard errors, no warnings (100 <= 200).
-        hard = [e for e in errors if not e.startswith("WARNING:")]
+        hard, warnings = _split(errors)
         assert hard == []
-        warnings = [e for e in errors if e.startswith("WARNING:")]
         assert warnings == []
 
     def test_zero_amount_fails(self) -> None:
@@ -46,7 +59,7 @@ class TestValidateSettlement:
             user_a_id=USER_A,
             user_b_id=USER_B,
         )
-        assert any("positive" in e.lower() for e in errors)
+        assert _contains_ci(errors, "positive")
 
     def test_negative_amount_fails(self) -> None:
         """Negative amount should be rejected."""
@@ -56,7 +69,7 @@ class TestValidateSettlement:
             user_a_id=USER_A,
             user_b_id=USER_B,
         )
-        assert any("positive" in e.lower() for e in errors)
+        assert _contains_ci(errors, "positive")
 
     def test_payer_not_in_partnership_fails(self) -> None:
         """Payer not matching either partner should be rejected."""
@@ -66,7 +79,7 @@ class TestValidateSettlement:
             user_a_id=USER_A,
             user_b_id=USER_B,
         )
-        assert any("not one of the partners" in e.lower() for e in errors)
+        assert _contains_ci(errors, "not one of the partners")
 
     def test_same_partners_fails(self) -> None:
         """Partners with the same ID should be rejected."""
@@ -76,7 +89,7 @@ class TestValidateSettlement:
             user_a_id=USER_A,
             user_b_id=USER_A,
         )
-        assert any("different" in e.lower() for e in errors)
+        assert _contains_ci(errors, "different")
 
     def test_overpayment_warning(self) -> None:
         """Amount exceeding the balance should produce a warning."""
@@ -87,8 +100,7 @@ class TestValidateSettlement:
             user_b_id=USER_B,
             current_balance=Decimal("100"),  # B owes A 100
         )
-        hard = [e for e in errors if not e.startswith("WARNING:")]
-        warnings = [e for e in errors if e.startswith("WARNING:")]
+        hard, warnings = _split(errors)
         assert hard == []
         assert len(warnings) == 1
         assert "exceeds" in warnings[0].lower()
@@ -102,7 +114,7 @@ class TestValidateSettlement:
             user_b_id=USER_B,
             current_balance=Decimal("50"),  # B owes A 50 (A owes nothing)
         )
-        warnings = [e for e in errors if e.startswith("WARNING:")]
+        _, warnings = _split(errors)
         assert len(warnings) == 1
         assert "does not currently owe" in warnings[0].lower()
 
@@ -115,7 +127,7 @@ class TestValidateSettlement:
             user_b_id=USER_B,
             current_balance=Decimal("-50"),  # A owes B 50 (B owes nothing)
         )
-        warnings = [e for e in errors if e.startswith("WARNING:")]
+        _, warnings = _split(errors)
         assert len(warnings) == 1
         assert "does not currently owe" in warnings[0].lower()
 
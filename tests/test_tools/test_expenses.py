@@ -18,6 +18,19 @@ from finbot.tools.expenses import (
     ParseExpenseResult,
     parse_expense,
 )
+from finbot.tools.registry import default_registry
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+
+
+def _build_expense(**kwargs: object) -> ParsedExpense:
+    """Build a ParsedExpense from trusted literals, skipping validation.
+
+    Only for tests where the expense is input to something else; tests of
+    ParsedExpense itself construct it normally.
+    """
+    return ParsedExpense.model_construct(**kwargs)
+
 
 # ── ParsedExpense model tests ─────────────────────────────────────────────────
 
@@ -58,13 +71,13 @@ def test_parsed_expense_full() -> None:
 def test_parsed_expense_requires_amount() -> None:
     """ParsedExpense should reject missing amount."""
     with pytest.raises(ValidationError):
-        ParsedExpense()  # type: ignore[call-arg]
+        ParsedExpense.model_validate({})
 
 
 def test_parsed_expense_amount_must_be_numeric() -> None:
     """ParsedExpense should reject non-numeric amount."""
     with pytest.raises(ValidationError):
-        ParsedExpense(amount="not a number")  # type: ignore[arg-type]
+        ParsedExpense.model_validate({"amount": "not a number"})
 
 
 # ── ParseExpenseResult model tests ────────────────────────────────────────────
@@ -82,8 +95,8 @@ def test_parse_expense_result_with_expenses() -> None:
     """ParseExpenseResult should hold a list of ParsedExpense objects."""
     result = ParseExpenseResult(
         expenses=[
-            ParsedExpense(amount=300, category="groceries"),
-            ParsedExpense(amount=200, category="gas"),
+            _build_expense(amount=300, category="groceries"),
+            _build_expense(amount=200, category="gas"),
         ],
         intent="expense",
         raw_text="groceries 300 and gas 200",
@@ -95,6 +108,10 @@ def test_parse_expense_result_with_expenses() -> None:
 
 # ── PARSE_EXPENSE_SCHEMA tests ───────────────────────────────────────────────
 
+_EXPENSES_SCHEMA = PARSE_EXPENSE_SCHEMA["properties"]["expenses"]
+_ITEM_SCHEMA = _EXPENSES_SCHEMA["items"]
+_INTENT_SCHEMA = PARSE_EXPENSE_SCHEMA["properties"]["intent"]
+
 
 def test_schema_has_required_structure() -> None:
     """The JSON schema should have the expected top-level structure."""
@@ -106,23 +123,18 @@ def test_schema_has_required_structure() -> None:
 
 
 def test_schema_expenses_is_array() -> None:
-    expenses_schema = PARSE_EXPENSE_SCHEMA["properties"]["expenses"]
-    assert expenses_schema["type"] == "array"
-    assert "items" in expenses_schema
+    assert _EXPENSES_SCHEMA["type"] == "array"
+    assert "items" in _EXPENSES_SCHEMA
 
 
 def test_schema_expense_item_has_amount() -> None:
-    item_schema = PARSE_EXPENSE_SCHEMA["properties"]["expenses"]["items"]
-    assert "amount" in item_schema["properties"]
-    assert "amount" in item_schema["required"]
+    assert "amount" in _ITEM_SCHEMA["properties"]
+    assert "amount" in _ITEM_SCHEMA["required"]
 
 
 def test_schema_intent_enum() -> None:
-    intent_schema = PARSE_EXPENSE_SCHEMA["properties"]["intent"]
-    assert intent_schema["type"] == "string"
-    assert "expense" in intent_schema["enum"]
-    assert "settlement" in intent_schema["enum"]
-    assert "query" in intent_schema["enum"]
+    assert _INTENT_SCHEMA["type"] == "string"
+    assert {"expense", "settlement", "query"} <= set(_INTENT_SCHEMA["enum"])
 
 
 # ── parse_expense tool tests ──────────────────────────────────────────────────
@@ -141,8 +153,6 @@ async def test_parse_expense_tool_returns_raw_text() -> None:
 
 def test_parse_expense_registered_in_default_registry() -> None:
     """parse_expense should be registered in the default tool registry."""
-    from finbot.tools.registry import default_registry
-
     tool = default_registry.get_tool("parse_expense")
     assert tool is not None
     assert tool.name == "parse_expense"
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import itertools
 from datetime import date
 from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any, NamedTuple
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
 
@@ -16,14 +19,48 @@ from finbot.tools.queries import get_balance, get_recent_entries, query_expenses
 USER_ID = 100
 PARTNER_ID = 200
 
+# Every repository call is patched, so the session is only passed through.
+_SESSION = object()
 
-def _mock_partnership():
-    """Create a mock Partnership object."""
-    p = MagicMock()
-    p.user_a_telegram_id = USER_ID
-    p.user_b_telegram_id = PARTNER_ID
-    p.default_currency = "ILS"
-    return p
+
+# Read-only partnership row shared by every test.
+_PARTNERSHIP = SimpleNamespace(
+    user_a_telegram_id=USER_ID,
+    user_b_telegram_id=PARTNER_ID,
+    default_currency="ILS",
+)
+
+_QUERIES = "finbot.tools.queries"
+
+
+def _patch_queries(**mocks: MagicMock) -> Any:
+    """Patch the query tools' repository helpers in a single ``patch.multiple``.
+
+    The partnership lookups default to :data:`_PARTNERSHIP` and
+    ``PARTNER_ID``; *mocks* adds or overrides attributes.
+    """
+    defaults = {
+        "get_partnership": AsyncMock(return_value=_PARTNERSHIP),
+        "get_partner_id": MagicMock(return_value=PARTNER_ID),
+    }
+    return patch.multiple(_QUERIES, **{**defaults, **mocks})
+
+
+# Deterministic, distinct entry ids without drawing random UUIDs.
+_next_id = itertools.count(1).__next__
+
+
+class _Entry(NamedTuple):
+    """Attribute-only stand-in for a LedgerEntry row."""
+
+    id: UUID
+    event_type: str
+    amount: Decimal
+    currency: str
+    category: str
+    payer_telegram_id: int
+    event_date: date
+    description: str | None
 
 
 def _mock_entry(
@@ -35,18 +72,18 @@ def _mock_entry(
     event_date: date = date(2025, 12, 5),
     description: str | None = None,
     currency: str = "ILS",
-) -> MagicMock:
-    """Create a mock LedgerEntry."""
-    entry = MagicMock()
-    entry.id = uuid4()
-    entry.event_type = event_type
-    entry.amount = amount
-    entry.currency = currency
-    entry.category = category
-    entry.payer_telegram_id = payer_id
-    entry.event_date = event_date
-    entry.description = description
-    return entry
+) -> _Entry:
+    """Create a LedgerEntry stand-in."""
+    return _Entry(
+        id=UUID(int=_next_id()),
+        event_type=event_type,
+        amount=amount,
+        currency=currency,
+        category=category,
+        payer_telegram_id=payer_id,
+        event_date=event_date,
+        description=description,
+    )
 
 
 # ── get_balance tests ─────────────────────────────────────────────────────────
@@ -62,33 +99,14 @@ class TestGetBalance:
 
     @pytest.mark.asyncio
     async def test_missing_partnership_returns_error(self) -> None:
-        session = AsyncMock()
-        with patch(
-            "finbot.tools.queries.get_partnership",
-            return_value=None,
-        ):
-            result = await get_balance(session=session, user_id=USER_ID)
+        with _patch_queries(get_partnership=AsyncMock(return_value=None)):
+            result = await get_balance(session=_SESSION, user_id=USER_ID)
         assert "error" in result
 
     @pytest.mark.asyncio
     async def test_partner_owes_user(self) -> None:
-        session = AsyncMock()
-
-        with (
-            patch(
-                "finbot.tools.queries.get_partnership",
-                return_value=_mock_partnership(),
-            ),
-            patch(
-                "finbot.tools.queries.get_partner_id",
-                return_value=PARTNER_ID,
-            ),
-            patch(
-                "finbot.tools.queries._derive_balance",
-                return_value=Decimal("150"),
-            ),
-        ):
-            result = await get_balance(session=session, user_id=USER_ID)
+        with _patch_queries(_derive_balance=AsyncMock(return_value=Decimal("150"))):
+            result = await get_balance(session=_SESSION, user_id=USER_ID)
 
         assert result["who_owes"] == "partner_owes_user"
         assert result["balance"] == "150"
@@ -96,46 +114,16 @@ class TestGetBalance:
 
     @pytest.mark.asyncio
     async def test_user_owes_partner(self) -> None:
-        session = AsyncMock()
-
-        with (
-            patch(
-                "finbot.tools.queries.get_partnership",
-                return_value=_mock_partnership(),
-            ),
-            patch(
-                "finbot.tools.queries.get_partner_id",
-                return_value=PARTNER_ID,
-            ),
-            patch(
-                "finbot.tools.queries._derive_balance",
-                return_value=Decimal("-200"),
-            ),
-        ):
-            result = await get_balance(session=session, user_id=USER_ID)
+        with _patch_queries(_derive_balance=AsyncMock(return_value=Decimal("-200"))):
+            result = await get_balance(session=_SESSION, user_id=USER_ID)
 
         assert result["who_owes"] == "user_owes_partner"
         assert result["balance"] == "-200"
 
     @pytest.mark.asyncio
     async def test_settled_up(self) -> None:
-        session = AsyncMock()
-
-        with (
-            patch(
-                "finbot.tools.queries.get_partnership",
-                return_value=_mock_partnership(),
-            ),
-            patch(
-                "finbot.tools.queries.get_partner_id",
-                return_value=PARTNER_ID,
-            ),
-            patch(
-                "finbot.tools.queries._derive_balance",
-                return_value=Decimal("0"),
-            ),
-        ):
-            result = await get_balance(session=session, user_id=USER_ID)
+        with _patch_queries(_derive_balance=AsyncMock(return_value=Decimal("0"))):
+            result = await get_balance(session=_SESSION, user_id=USER_ID)
 
         assert result["who_owes"] == "settled"
 
@@ -153,25 +141,10 @@ class TestQueryExpenses:
 
     @pytest.mark.asyncio
     async def test_no_matching_entries(self) -> None:
-        session = AsyncMock()
-
-        with (
-            patch(
-                "finbot.tools.queries.get_partnership",
-                return_value=_mock_partnership(),
-            ),
-            patch(
-                "finbot.tools.queries.get_partner_id",
-                return_value=PARTNER_ID,
-            ),
-            patch(
-                "finbot.tools.queries.get_filtered_entries",
-                return_value=[],
-            ),
-        ):
+        with _patch_queries(get_filtered_entries=AsyncMock(return_value=[])):
             result = await query_expenses(
                 category="unicorns",
-                session=session,
+                session=_SESSION,
                 user_id=USER_ID,
             )
 
@@ -181,29 +154,15 @@ class TestQueryExpenses:
 
     @pytest.mark.asyncio
     async def test_matching_entries(self) -> None:
-        session = AsyncMock()
         entries = [
             _mock_entry(amount=Decimal("300"), category="groceries"),
             _mock_entry(amount=Decimal("200"), category="groceries"),
         ]
 
-        with (
-            patch(
-                "finbot.tools.queries.get_partnership",
-                return_value=_mock_partnership(),
-            ),
-            patch(
-                "finbot.tools.queries.get_partner_id",
-                return_value=PARTNER_ID,
-            ),
-            patch(
-                "finbot.tools.queries.get_filtered_entries",
-                return_value=entries,
-            ),
-        ):
+        with _patch_queries(get_filtered_entries=AsyncMock(return_value=entries)):
             result = await query_expenses(
                 category="groceries",
-                session=session,
+                session=_SESSION,
                 user_id=USER_ID,
             )
 
@@ -215,26 +174,12 @@ class TestQueryExpenses:
     @pytest.mark.asyncio
     async def test_date_filters_passed_through(self) -> None:
         """date_from and date_to should be parsed and passed to repository."""
-        session = AsyncMock()
-
-        with (
-            patch(
-                "finbot.tools.queries.get_partnership",
-                return_value=_mock_partnership(),
-            ),
-            patch(
-                "finbot.tools.queries.get_partner_id",
-                return_value=PARTNER_ID,
-            ),
-            patch(
-                "finbot.tools.queries.get_filtered_entries",
-                return_value=[],
-            ) as mock_filter,
-        ):
+        mock_filter = AsyncMock(return_value=[])
+        with _patch_queries(get_filtered_entries=mock_filter):
             await query_expenses(
                 date_from="2025-12-01",
                 date_to="2025-12-31",
-                session=session,
+                session=_SESSION,
                 user_id=USER_ID,
             )
 
@@ -245,27 +190,13 @@ class TestQueryExpenses:
     @pytest.mark.asyncio
     async def test_payer_labels(self) -> None:
         """Entries should have 'you' or 'partner' payer labels."""
-        session = AsyncMock()
         entries = [
             _mock_entry(payer_id=USER_ID),
             _mock_entry(payer_id=PARTNER_ID),
         ]
 
-        with (
-            patch(
-                "finbot.tools.queries.get_partnership",
-                return_value=_mock_partnership(),
-            ),
-            patch(
-                "finbot.tools.queries.get_partner_id",
-                return_value=PARTNER_ID,
-            ),
-            patch(
-                "finbot.tools.queries.get_filtered_entries",
-                return_value=entries,
-            ),
-        ):
-            result = await query_expenses(session=session, user_id=USER_ID)
+        with _patch_queries(get_filtered_entries=AsyncMock(return_value=entries)):
+            result = await query_expenses(session=_SESSION, user_id=USER_ID)
 
         assert result["entries"][0]["payer"] == "you"
         assert result["entries"][1]["payer"] == "partner"
@@ -284,29 +215,15 @@ class TestGetRecentEntries:
 
     @pytest.mark.asyncio
     async def test_returns_entries(self) -> None:
-        session = AsyncMock()
         entries = [
             _mock_entry(amount=Decimal("100")),
             _mock_entry(amount=Decimal("200")),
         ]
 
-        with (
-            patch(
-                "finbot.tools.queries.get_partnership",
-                return_value=_mock_partnership(),
-            ),
-            patch(
-                "finbot.tools.queries.get_partner_id",
-                return_value=PARTNER_ID,
-            ),
-            patch(
-                "finbot.tools.queries._fetch_recent",
-                return_value=entries,
-            ),
-        ):
+        with _patch_queries(_fetch_recent=AsyncMock(return_value=entries)):
             result = await get_recent_entries(
                 limit=5,
-                session=session,
+                session=_SESSION,
                 user_id=USER_ID,
             )
 
@@ -315,12 +232,7 @@ class TestGetRecentEntries:
 
     @pytest.mark.asyncio
     async def test_missing_partnership_returns_error(self) -> None:
-        session = AsyncMock()
-
-        with patch(
-            "finbot.tools.queries.get_partnership",
-            return_value=None,
-        ):
-            result = await get_recent_entries(session=session, user_id=USER_ID)
+        with _patch_queries(get_partnership=AsyncMock(return_value=None)):
+            result = await get_recent_entries(session=_SESSION, user_id=USER_ID)
 
         assert "error" in result
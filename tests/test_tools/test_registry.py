@@ -10,17 +10,83 @@ Tests cover:
 
 from __future__ import annotations
 
+from operator import attrgetter
+
 import pytest
 
-from finbot.tools.registry import ToolRegistry
+from finbot.tools.registry import ToolDef, ToolRegistry
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def registry() -> ToolRegistry:
+    """A fresh, empty registry for tests that register tools."""
+    return ToolRegistry()
+
+
+_EMPTY_SCHEMA = {"type": "object", "properties": {}}
+_PARSE_SCHEMA = {
+    "type": "object",
+    "properties": {"text": {"type": "string"}},
+    "required": ["text"],
+}
+_ADD_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "a": {"type": "integer"},
+        "b": {"type": "integer"},
+    },
+    "required": ["a", "b"],
+}
+
+
+async def _noop() -> None:
+    pass
+
+
+async def _parse(text: str) -> dict:
+    return {}
+
+
+async def _adder(a: int, b: int) -> int:
+    return a + b
+
+
+@pytest.fixture(scope="module")
+def populated_registry() -> ToolRegistry:
+    """Registry with tools ``a``, ``b``, ``parse`` and ``add``, built once.
+
+    Shared by the read-only lookup, listing, export and execution tests; do
+    not register anything on it.
+    """
+    registry = ToolRegistry()
+    registry.register_many(
+        [
+            ToolDef(name="a", description="A", parameters_schema={}, handler=_noop),
+            ToolDef(name="b", description="B", parameters_schema={}, handler=_noop),
+            ToolDef(
+                name="parse",
+                description="Parse text.",
+                parameters_schema=_PARSE_SCHEMA,
+                handler=_parse,
+            ),
+            ToolDef(
+                name="add",
+                description="Add two numbers.",
+                parameters_schema=_ADD_SCHEMA,
+                handler=_adder,
+            ),
+        ]
+    )
+    return registry
+
 
 # ── Registration tests ────────────────────────────────────────────────────────
 
 
-@pytest.mark.asyncio
-async def test_register_tool_via_decorator() -> None:
+def test_register_tool_via_decorator(registry: ToolRegistry) -> None:
     """Tools registered via decorator should be retrievable."""
-    registry = ToolRegistry()
 
     @registry.tool(
         name="test_tool",
@@ -37,9 +103,8 @@ async def test_register_tool_via_decorator() -> None:
     assert tool.handler is my_tool
 
 
-def test_register_tool_imperatively() -> None:
+def test_register_tool_imperatively(registry: ToolRegistry) -> None:
     """Tools registered via register() should be retrievable."""
-    registry = ToolRegistry()
 
     async def handler(x: int) -> int:
         return x * 2
@@ -60,9 +125,8 @@ def test_register_tool_imperatively() -> None:
     assert tool.name == "double"
 
 
-def test_duplicate_registration_raises() -> None:
+def test_duplicate_registration_raises(registry: ToolRegistry) -> None:
     """Registering the same tool name twice should raise ValueError."""
-    registry = ToolRegistry()
 
     async def handler() -> None:
         pass
@@ -70,7 +134,7 @@ def test_duplicate_registration_raises() -> None:
     registry.register(
         name="dup",
         description="First.",
-        parameters_schema={"type": "object", "properties": {}},
+        parameters_schema=_EMPTY_SCHEMA,
         handler=handler,
     )
 
@@ -78,19 +142,18 @@ def test_duplicate_registration_raises() -> None:
         registry.register(
             name="dup",
             description="Second.",
-            parameters_schema={"type": "object", "properties": {}},
+            parameters_schema=_EMPTY_SCHEMA,
             handler=handler,
         )
 
 
-def test_duplicate_decorator_registration_raises() -> None:
+def test_duplicate_decorator_registration_raises(registry: ToolRegistry) -> None:
     """Decorating two functions with the same tool name should raise."""
-    registry = ToolRegistry()
 
     @registry.tool(
         name="same_name",
         description="First.",
-        parameters_schema={"type": "object", "properties": {}},
+        parameters_schema=_EMPTY_SCHEMA,
     )
     async def first() -> None:
         pass
@@ -100,69 +163,70 @@ def test_duplicate_decorator_registration_raises() -> None:
         @registry.tool(
             name="same_name",
             description="Second.",
-            parameters_schema={"type": "object", "properties": {}},
+            parameters_schema=_EMPTY_SCHEMA,
         )
         async def second() -> None:
             pass
 
 
-# ── Lookup and listing ────────────────────────────────────────────────────────
+def test_register_many_adds_all(registry: ToolRegistry) -> None:
+    """register_many() should add every tool in the batch."""
+    registry.register_many(
+        ToolDef(name=n, description=n, parameters_schema=_EMPTY_SCHEMA, handler=_noop)
+        for n in ("x", "y")
+    )
+    assert registry.get_tool("x") is not None
+    assert registry.get_tool("y") is not None
 
 
-def test_get_tool_returns_none_for_unknown() -> None:
-    registry = ToolRegistry()
-    assert registry.get_tool("nonexistent") is None
+def test_register_many_is_all_or_nothing(registry: ToolRegistry) -> None:
+    """A batch with a taken name should raise and register nothing."""
+    registry.register(
+        name="taken", description="First.", parameters_schema=_EMPTY_SCHEMA, handler=_noop
+    )
 
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register_many(
+            [
+                ToolDef(name="fresh", description="", parameters_schema={}, handler=_noop),
+                ToolDef(name="taken", description="", parameters_schema={}, handler=_noop),
+            ]
+        )
 
-def test_list_tools_returns_all() -> None:
-    registry = ToolRegistry()
+    assert registry.get_tool("fresh") is None
+    assert registry.get_tool("taken").description == "First."
 
-    async def handler() -> None:
-        pass
 
-    registry.register(name="a", description="A", parameters_schema={}, handler=handler)
-    registry.register(name="b", description="B", parameters_schema={}, handler=handler)
+# ── Lookup and listing ────────────────────────────────────────────────────────
 
-    tools = registry.list_tools()
-    assert len(tools) == 2
-    names = {t.name for t in tools}
-    assert names == {"a", "b"}
 
+def test_get_tool_returns_none_for_unknown(populated_registry: ToolRegistry) -> None:
+    assert populated_registry.get_tool("nonexistent") is None
 
-# ── Schema export ─────────────────────────────────────────────────────────────
 
+def test_list_tools_returns_all(populated_registry: ToolRegistry) -> None:
+    tools = populated_registry.list_tools()
+    assert len(tools) == 4
+    names = set(map(attrgetter("name"), tools))
+    assert names == {"a", "b", "parse", "add"}
 
-def test_get_tools_for_llm_format() -> None:
-    """Exported schemas should match the OpenAI function-calling format."""
-    registry = ToolRegistry()
 
-    async def handler(text: str) -> dict:
-        return {}
+# ── Schema export ─────────────────────────────────────────────────────────────
 
-    registry.register(
-        name="parse",
-        description="Parse text.",
-        parameters_schema={
-            "type": "object",
-            "properties": {"text": {"type": "string"}},
-            "required": ["text"],
-        },
-        handler=handler,
-    )
 
-    schemas = registry.get_tools_for_llm()
-    assert len(schemas) == 1
+def test_get_tools_for_llm_format(populated_registry: ToolRegistry) -> None:
+    """Exported schemas should match the OpenAI function-calling format."""
+    schemas = populated_registry.get_tools_for_llm()
+    assert len(schemas) == 4
 
-    schema = schemas[0]
+    schema = next(s for s in schemas if s["function"]["name"] == "parse")
     assert schema["type"] == "function"
-    assert schema["function"]["name"] == "parse"
     assert schema["function"]["description"] == "Parse text."
     assert schema["function"]["parameters"]["type"] == "object"
     assert "text" in schema["function"]["parameters"]["properties"]
 
 
-def test_get_tools_for_llm_empty_registry() -> None:
-    registry = ToolRegistry()
+def test_get_tools_for_llm_empty_registry(registry: ToolRegistry) -> None:
     assert registry.get_tools_for_llm() == []
 
 
@@ -170,35 +234,14 @@ def test_get_tools_for_llm_empty_registry() -> None:
 
 
 @pytest.mark.asyncio
-async def test_execute_tool_calls_handler() -> None:
+async def test_execute_tool_calls_handler(populated_registry: ToolRegistry) -> None:
     """execute_tool should invoke the handler with the provided arguments."""
-    registry = ToolRegistry()
-
-    async def adder(a: int, b: int) -> int:
-        return a + b
-
-    registry.register(
-        name="add",
-        description="Add two numbers.",
-        parameters_schema={
-            "type": "object",
-            "properties": {
-                "a": {"type": "integer"},
-                "b": {"type": "integer"},
-            },
-            "required": ["a", "b"],
-        },
-        handler=adder,
-    )
-
-    result = await registry.execute_tool("add", {"a": 3, "b": 7})
+    result = await populated_registry.execute_tool("add", {"a": 3, "b": 7})
     assert result == 10
 
 
 @pytest.mark.asyncio
-async def test_execute_unknown_tool_raises() -> None:
+async def test_execute_unknown_tool_raises(populated_registry: ToolRegistry) -> None:
     """execute_tool should raise KeyError for unregistered tools."""
-    registry = ToolRegistry()
-
     with pytest.raises(KeyError, match="Unknown tool"):
-        await registry.execute_tool("nonexistent", {})
+        await populated_registry.execute_tool("nonexistent", {})
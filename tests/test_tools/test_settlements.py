@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock, patch
+from operator import itemgetter
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 
+from finbot.tools import settlements
 from finbot.tools.settlements import log_settlement, validate_settlement_tool
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -15,14 +18,67 @@ from finbot.tools.settlements import log_settlement, validate_settlement_tool
 USER_ID = 100
 PARTNER_ID = 200
 
+# Every repository call is patched, so the session is only passed through.
+_SESSION = object()
 
-def _mock_partnership():
-    """Create a mock Partnership object."""
-    p = MagicMock()
-    p.user_a_telegram_id = USER_ID
-    p.user_b_telegram_id = PARTNER_ID
-    p.default_currency = "ILS"
-    return p
+_RAW_ID = uuid4()
+_ENTRY_ID = uuid4()
+
+# What the patched save_ledger_entry returns; the tools only read its id.
+_SAVED_ENTRY = SimpleNamespace(id=_ENTRY_ID)
+
+# Session and ids for calls that reach the patched helpers.
+_CONTEXT = {"session": _SESSION, "user_id": USER_ID, "raw_input_id": _RAW_ID}
+
+# save_ledger_entry keyword arguments checked by the commit test.
+_SAVED_FIELDS = itemgetter(
+    "event_type", "amount", "payer_telegram_id", "split_payer_pct", "split_other_pct"
+)
+
+# Read-only partnership row shared by every test.
+_PARTNERSHIP = SimpleNamespace(
+    user_a_telegram_id=USER_ID,
+    user_b_telegram_id=PARTNER_ID,
+    default_currency="ILS",
+)
+
+
+@pytest.fixture(scope="module")
+def save_ledger_entry_mock() -> AsyncMock:
+    """``save_ledger_entry`` stand-in built once and reset before each test."""
+    return AsyncMock(return_value=_SAVED_ENTRY)
+
+
+@pytest.fixture
+def settlements_patched(
+    monkeypatch: pytest.MonkeyPatch, save_ledger_entry_mock: AsyncMock
+) -> SimpleNamespace:
+    """Replace the settlement tools' repository and balance helpers.
+
+    The lookups are plain functions reading ``partnership`` and ``balance``
+    from the returned namespace, which default to :data:`_PARTNERSHIP` and
+    zero; tests reassign them. ``save_ledger_entry`` is the shared
+    :class:`AsyncMock` returning ``_SAVED_ENTRY``, with its call history
+    cleared so each test can check its own calls.
+    """
+    save_ledger_entry_mock.reset_mock()
+    state = SimpleNamespace(
+        partnership=_PARTNERSHIP,
+        balance=Decimal("0"),
+        save_ledger_entry=save_ledger_entry_mock,
+    )
+
+    async def get_partnership(session: object, user_id: int) -> SimpleNamespace | None:
+        return state.partnership
+
+    async def derive_balance(session: object, user_id: int, partner_id: int) -> Decimal:
+        return state.balance
+
+    monkeypatch.setattr(settlements, "get_partnership", get_partnership)
+    monkeypatch.setattr(settlements, "get_partner_id", lambda partnership, user_id: PARTNER_ID)
+    monkeypatch.setattr(settlements, "_derive_balance", derive_balance)
+    monkeypatch.setattr(settlements, "save_ledger_entry", state.save_ledger_entry)
+    return state
 
 
 # ── log_settlement tests ─────────────────────────────────────────────────────
@@ -32,149 +88,81 @@ class TestLogSettlement:
     """Tests for the log_settlement tool."""
 
     @pytest.mark.asyncio
-    async def test_missing_session_returns_error(self) -> None:
-        """log_settlement without session should return an error."""
-        result = await log_settlement(
-            amount=500,
-            payer="user",
-        )
-        assert "error" in result
+    @pytest.mark.parametrize(
+        ("kwargs", "partnership", "needle"),
+        [
+            pytest.param({"amount": 500}, _PARTNERSHIP, None, id="missing_session"),
+            pytest.param({"amount": 500, **_CONTEXT}, None, "partnership", id="no_partnership"),
+            pytest.param({"amount": -100, **_CONTEXT}, _PARTNERSHIP, "positive", id="negative"),
+        ],
+    )
+    async def test_returns_error(
+        self,
+        settlements_patched: SimpleNamespace,
+        kwargs: dict[str, object],
+        partnership: SimpleNamespace | None,
+        needle: str | None,
+    ) -> None:
+        """Each rejected call should return an error and save nothing."""
+        settlements_patched.partnership = partnership
+
+        result = await log_settlement(payer="user", **kwargs)
 
-    @pytest.mark.asyncio
-    async def test_missing_partnership_returns_error(self) -> None:
-        """log_settlement without a partnership should return an error."""
-        session = AsyncMock()
-
-        with patch(
-            "finbot.tools.settlements.get_partnership",
-            return_value=None,
-        ):
-            result = await log_settlement(
-                amount=500,
-                payer="user",
-                session=session,
-                user_id=USER_ID,
-                raw_input_id=uuid4(),
-            )
         assert "error" in result
-        assert "partnership" in result["error"].lower()
+        if needle is not None:
+            assert needle in result["error"].lower()
+        settlements_patched.save_ledger_entry.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_valid_settlement_commits(self) -> None:
-        """A valid settlement should be committed to the ledger."""
-        session = AsyncMock()
-        raw_id = uuid4()
-        entry_id = uuid4()
-
-        mock_entry = MagicMock()
-        mock_entry.id = entry_id
-
-        with (
-            patch(
-                "finbot.tools.settlements.get_partnership",
-                return_value=_mock_partnership(),
-            ),
-            patch(
-                "finbot.tools.settlements.get_partner_id",
-                return_value=PARTNER_ID,
-            ),
-            patch(
-                "finbot.tools.settlements._derive_balance",
-                return_value=Decimal("500"),
-            ),
-            patch(
-                "finbot.tools.settlements.save_ledger_entry",
-                return_value=mock_entry,
-            ) as mock_save,
-        ):
-            result = await log_settlement(
-                amount=300,
-                payer="user",
-                description="Test settlement",
-                session=session,
-                user_id=USER_ID,
-                raw_input_id=raw_id,
-            )
+    @pytest.mark.parametrize(
+        ("payer", "expected_payer_id"),
+        [("user", USER_ID), ("partner", PARTNER_ID)],
+    )
+    async def test_valid_settlement_commits(
+        self, settlements_patched: SimpleNamespace, payer: str, expected_payer_id: int
+    ) -> None:
+        """A valid settlement should be committed with the resolved payer ID."""
+        settlements_patched.balance = Decimal("500")
+
+        result = await log_settlement(
+            amount=300,
+            payer=payer,
+            description="Test settlement",
+            session=_SESSION,
+            user_id=USER_ID,
+            raw_input_id=_RAW_ID,
+        )
 
         assert result["success"] is True
-        assert result["entry_id"] == str(entry_id)
+        assert result["entry_id"] == str(_ENTRY_ID)
 
         # Verify save_ledger_entry was called with correct args.
+        mock_save = settlements_patched.save_ledger_entry
         mock_save.assert_called_once()
-        call_kwargs = mock_save.call_args[1]
-        assert call_kwargs["event_type"] == "settlement"
-        assert call_kwargs["amount"] == Decimal("300")
-        assert call_kwargs["payer_telegram_id"] == USER_ID
-        assert call_kwargs["split_payer_pct"] == Decimal("100")
-        assert call_kwargs["split_other_pct"] == Decimal("0")
+        assert _SAVED_FIELDS(mock_save.call_args.kwargs) == (
+            "settlement",
+            Decimal("300"),
+            expected_payer_id,
+            Decimal("100"),
+            Decimal("0"),
+        )
 
     @pytest.mark.asyncio
-    async def test_negative_amount_returns_error(self) -> None:
-        """Negative amount should fail validation."""
-        session = AsyncMock()
-
-        with (
-            patch(
-                "finbot.tools.settlements.get_partnership",
-                return_value=_mock_partnership(),
-            ),
-            patch(
-                "finbot.tools.settlements.get_partner_id",
-                return_value=PARTNER_ID,
-            ),
-            patch(
-                "finbot.tools.settlements._derive_balance",
-                return_value=Decimal("0"),
-            ),
-        ):
-            result = await log_settlement(
-                amount=-100,
-                payer="user",
-                session=session,
-                user_id=USER_ID,
-                raw_input_id=uuid4(),
-            )
+    @pytest.mark.parametrize("amount", [0, -100])
+    async def test_non_positive_amount_skips_balance(
+        self,
+        settlements_patched: SimpleNamespace,
+        monkeypatch: pytest.MonkeyPatch,
+        amount: int,
+    ) -> None:
+        """Amounts that fail validation should not trigger a ledger replay."""
+        derive = AsyncMock()
+        monkeypatch.setattr(settlements, "_derive_balance", derive)
+
+        result = await log_settlement(amount=amount, payer="user", **_CONTEXT)
 
         assert "error" in result
-        assert "positive" in result["error"].lower()
-
-    @pytest.mark.asyncio
-    async def test_partner_payer(self) -> None:
-        """When payer is 'partner', the partner ID should be used."""
-        session = AsyncMock()
-        raw_id = uuid4()
-        mock_entry = MagicMock()
-        mock_entry.id = uuid4()
-
-        with (
-            patch(
-                "finbot.tools.settlements.get_partnership",
-                return_value=_mock_partnership(),
-            ),
-            patch(
-                "finbot.tools.settlements.get_partner_id",
-                return_value=PARTNER_ID,
-            ),
-            patch(
-                "finbot.tools.settlements._derive_balance",
-                return_value=Decimal("0"),
-            ),
-            patch(
-                "finbot.tools.settlements.save_ledger_entry",
-                return_value=mock_entry,
-            ) as mock_save,
-        ):
-            result = await log_settlement(
-                amount=200,
-                payer="partner",
-                session=session,
-                user_id=USER_ID,
-                raw_input_id=raw_id,
-            )
-
-        assert result["success"] is True
-        call_kwargs = mock_save.call_args[1]
-        assert call_kwargs["payer_telegram_id"] == PARTNER_ID
+        derive.assert_not_awaited()
 
 
 # ── validate_settlement_tool tests ───────────────────────────────────────────
@@ -189,57 +177,27 @@ class TestValidateSettlementTool:
         assert "error" in result
 
     @pytest.mark.asyncio
-    async def test_valid_settlement(self) -> None:
-        session = AsyncMock()
-
-        with (
-            patch(
-                "finbot.tools.settlements.get_partnership",
-                return_value=_mock_partnership(),
-            ),
-            patch(
-                "finbot.tools.settlements.get_partner_id",
-                return_value=PARTNER_ID,
-            ),
-            patch(
-                "finbot.tools.settlements._derive_balance",
-                return_value=Decimal("300"),
-            ),
-        ):
-            result = await validate_settlement_tool(
-                amount=200,
-                payer="partner",
-                session=session,
-                user_id=USER_ID,
-            )
+    async def test_valid_settlement(self, settlements_patched: SimpleNamespace) -> None:
+        settlements_patched.balance = Decimal("300")
+
+        result = await validate_settlement_tool(
+            amount=200,
+            payer="partner",
+            session=_SESSION,
+            user_id=USER_ID,
+        )
 
         assert result["valid"] is True
         assert result["errors"] == []
 
     @pytest.mark.asyncio
-    async def test_invalid_settlement(self) -> None:
-        session = AsyncMock()
-
-        with (
-            patch(
-                "finbot.tools.settlements.get_partnership",
-                return_value=_mock_partnership(),
-            ),
-            patch(
-                "finbot.tools.settlements.get_partner_id",
-                return_value=PARTNER_ID,
-            ),
-            patch(
-                "finbot.tools.settlements._derive_balance",
-                return_value=Decimal("0"),
-            ),
-        ):
-            result = await validate_settlement_tool(
-                amount=-50,
-                payer="user",
-                session=session,
-                user_id=USER_ID,
-            )
+    async def test_invalid_settlement(self, settlements_patched: SimpleNamespace) -> None:
+        result = await validate_settlement_tool(
+            amount=-50,
+            payer="user",
+            session=_SESSION,
+            user_id=USER_ID,
+        )
 
         assert result["valid"] is False
         assert len(result["errors"]) > 0